@@ -9,8 +9,15 @@ from discord.ext import commands, tasks
 from discord.ext.commands import Context
 from dotenv import load_dotenv
 
-from database import DatabaseManager
-from utils import ascii, setup_logger, get_uptime, setup_signal_handlers
+from database import DatabaseManager, apply_migrations
+from utils import (
+    ascii,
+    setup_logger,
+    get_uptime,
+    setup_signal_handlers,
+    HTTPClient,
+    GitHubClient,
+)
 
 load_dotenv()
 
@@ -38,9 +45,6 @@ intents.presences = True
 intents.members = True
 
 
-logger = setup_logger()
-
-
 class DiscordBot(commands.Bot):
     def __init__(self) -> None:
         super().__init__(
@@ -50,6 +54,8 @@ class DiscordBot(commands.Bot):
         )
         self.logger = logger
         self.database = None
+        self.http_client = None
+        self.github = None
         self.bot_prefix = os.getenv("PREFIX")
         self.invite_link = os.getenv("INVITE_LINK")
         self.start_time = time.time()
@@ -66,6 +72,10 @@ class DiscordBot(commands.Bot):
                 await db.executescript(file.read())
             await db.commit()
 
+            applied = await apply_migrations(db)
+            for version in applied:
+                self.logger.info(f"Applied database migration {version:04d}")
+
     async def load_cogs(self) -> None:
         cogs_path = f"{os.path.realpath(os.path.dirname(__file__))}/cogs"
         disabled_env = os.getenv("DISABLED_COGS", "")
@@ -157,14 +167,18 @@ class DiscordBot(commands.Bot):
         except Exception as e:
             self.logger.error(f"Error fetching application info: {e}")
 
+        self.http_client = HTTPClient()
+        self.github = GitHubClient(self.http_client)
         await self.init_db()
-        await self.load_cogs()
-        self.status_task.start()
         self.database = DatabaseManager(
             connection=await aiosqlite.connect(
                 f"{os.path.realpath(os.path.dirname(__file__))}/database/database.db"
-            )
+            ),
+            logger=self.logger,
         )
+        await self.database.start()
+        await self.load_cogs()
+        self.status_task.start()
 
     def get_uptime(self) -> str:
         return get_uptime(self.start_time)
@@ -180,9 +194,16 @@ class DiscordBot(commands.Bot):
             self.status_task.cancel()
             self.logger.info("Status task cancelled")
 
+        if self.http_client and not self.http_client.closed:
+            try:
+                await self.http_client.close()
+                self.logger.info("HTTP client closed")
+            except Exception as e:
+                self.logger.error(f"Error closing HTTP client: {e}")
+
         if self.database and self.database.connection:
             try:
-                await self.database.connection.close()
+                await self.database.close()
                 self.logger.warning("Database connection closed")
             except Exception as e:
                 self.logger.error(f"Error closing database connection: {e}")
@@ -268,9 +289,10 @@ class DiscordBot(commands.Bot):
             raise error
 
 
-bot = DiscordBot()
-
 if __name__ == "__main__":
+    logger = setup_logger()
+    bot = DiscordBot()
+
     os.system("clear" if os.name == "posix" else "cls")
 
     print(ascii)
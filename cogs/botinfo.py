@@ -91,6 +91,17 @@ class BotInfo(commands.Cog, name="botinfo"):
     def __init__(self, bot) -> None:
         self.bot = bot
 
+    def get_github_budget(self) -> str:
+        if self.bot.github is None:
+            return "Unavailable"
+        budget = self.bot.github.budget()
+        text = f"{budget['remaining']}/{budget['limit']} requests left"
+        if budget["reset"]:
+            text += f" (resets <t:{int(budget['reset'])}:R>)"
+        if not self.bot.github.authenticated:
+            text += " • unauthenticated"
+        return text
+
     @commands.Cog.listener()
     async def on_guild_join(self, guild):
         channel = guild.system_channel or next(
@@ -157,7 +168,8 @@ class BotInfo(commands.Cog, name="botinfo"):
             f"**Owner:** [neoarz](https://discordapp.com/users/1015372540937502851)\n"
             f"**Python Version:** {platform.python_version()}\n"
             f"**Discord.py Version:** {discord.__version__}\n"
-            f"**Prefix:** / (Slash Commands) or {self.bot.bot_prefix} for normal commands"
+            f"**Prefix:** / (Slash Commands) or {self.bot.bot_prefix} for normal commands\n"
+            f"**GitHub API:** {self.get_github_budget()}"
         )
 
         embed1 = discord.Embed(
@@ -183,7 +195,7 @@ class BotInfo(commands.Cog, name="botinfo"):
             color=0x7289DA,
         )
 
-        contributors_image = generate_contributors_image()
+        contributors_image = await generate_contributors_image(self.bot.github)
 
         view = BotInfoView(self.bot)
 
@@ -11,6 +11,9 @@ from .stickybot import (
     has_allowed_role as has_sticky_role,
 )
 
+_baitbot = baitbot_command()
+_stickybot = stickybot_command()
+
 
 def _require_group_prefix(context: Context) -> bool:
     if getattr(context, "interaction", None):
@@ -50,23 +53,128 @@ class Events(commands.GroupCog, name="events"):
         else:
             await context.send(f"Unknown events command: {name}")
 
-    @events_group.command(name="baitbot")
+    async def _update_config_channel(
+        self,
+        context: Context,
+        listener_name: str,
+        title: str,
+        channel: discord.TextChannel,
+        *,
+        add: bool,
+    ):
+        listener = self.bot.get_cog(listener_name)
+        if listener is None or self.bot.database is None:
+            await context.send(f"{title} is not available right now.")
+            return
+
+        has_config = any(
+            config.get("guild_id") == context.guild.id
+            for config in listener.configs.values()
+        )
+        if not has_config:
+            embed = discord.Embed(
+                title="Error",
+                description=f"No {title.lower()} configuration exists for this server.",
+                color=0xE02B2B,
+            )
+            embed.set_author(
+                name="Events", icon_url="https://yes.nighty.works/raw/C8Hh6o.png"
+            )
+            await context.send(embed=embed)
+            return
+
+        if add:
+            changed = await self.bot.database.add_config_channel(
+                listener.config_kind, context.guild.id, channel.id
+            )
+        else:
+            changed = await self.bot.database.remove_config_channel(
+                listener.config_kind, context.guild.id, channel.id
+            )
+        await listener.reload_configs()
+
+        if changed:
+            description = (
+                f"Added {channel.mention} to {title.lower()}."
+                if add
+                else f"Removed {channel.mention} from {title.lower()}."
+            )
+            self.bot.logger.info(
+                f"[{listener.config_kind.upper()}BOT] {context.author} ({context.author.id}) {'added' if add else 'removed'} #{channel.name} ({channel.id}) in {context.guild.name}"
+            )
+        else:
+            description = (
+                f"{channel.mention} is already configured."
+                if add
+                else f"{channel.mention} is not configured."
+            )
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            color=0x7289DA if changed else 0xE02B2B,
+        )
+        embed.set_author(
+            name="Events", icon_url="https://yes.nighty.works/raw/C8Hh6o.png"
+        )
+        await context.send(embed=embed)
+
+    @events_group.group(name="baitbot", invoke_without_command=True)
     @has_protected_role()
     async def events_group_baitbot(self, context: Context):
         await self._invoke_hybrid(context, "baitbot")
 
-    @events_group.command(name="stickybot")
+    @events_group_baitbot.command(name="add")
+    @has_protected_role()
+    @commands.has_permissions(manage_guild=True)
+    async def events_group_baitbot_add(
+        self, context: Context, channel: discord.TextChannel
+    ):
+        await self._update_config_channel(
+            context, "BaitBotListener", "Bait Bot", channel, add=True
+        )
+
+    @events_group_baitbot.command(name="remove")
+    @has_protected_role()
+    @commands.has_permissions(manage_guild=True)
+    async def events_group_baitbot_remove(
+        self, context: Context, channel: discord.TextChannel
+    ):
+        await self._update_config_channel(
+            context, "BaitBotListener", "Bait Bot", channel, add=False
+        )
+
+    @events_group.group(name="stickybot", invoke_without_command=True)
     @has_sticky_role()
     async def events_group_stickybot(self, context: Context):
         await self._invoke_hybrid(context, "stickybot")
 
+    @events_group_stickybot.command(name="add")
+    @has_sticky_role()
+    @commands.has_permissions(manage_guild=True)
+    async def events_group_stickybot_add(
+        self, context: Context, channel: discord.TextChannel
+    ):
+        await self._update_config_channel(
+            context, "StickyBotListener", "Sticky Bot", channel, add=True
+        )
+
+    @events_group_stickybot.command(name="remove")
+    @has_sticky_role()
+    @commands.has_permissions(manage_guild=True)
+    async def events_group_stickybot_remove(
+        self, context: Context, channel: discord.TextChannel
+    ):
+        await self._update_config_channel(
+            context, "StickyBotListener", "Sticky Bot", channel, add=False
+        )
+
     @commands.check(_require_group_prefix)
     @has_protected_role()
     @commands.hybrid_command(
         name="baitbot", description="View bait bot configuration and status."
     )
     async def baitbot(self, context):
-        return await baitbot_command()(self, context)
+        return await _baitbot(self, context)
 
     @commands.check(_require_group_prefix)
     @has_sticky_role()
@@ -74,7 +182,7 @@ class Events(commands.GroupCog, name="events"):
         name="stickybot", description="View sticky bot configuration and status."
     )
     async def stickybot(self, context):
-        return await stickybot_command()(self, context)
+        return await _stickybot(self, context)
 
 
 async def setup(bot) -> None:
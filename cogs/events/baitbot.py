@@ -2,9 +2,14 @@ import discord
 from discord.ext import commands
 from discord.ext.commands import Context
 import asyncio
+import time
+from collections import OrderedDict
+
+from utils.routing import build_channel_index
 
 # Make a pr to add your own server config here, you shouldn't need to touch the rest of the file, please fill in all the values for your own server
-BAIT_CONFIGS = {
+# These are seeded into the database once, the first time the bot starts with them, after that use `.events baitbot add/remove` to change the channels
+DEFAULT_BAIT_CONFIGS = {
     "SideStore": {
         "guild_id": 949183273383395328,
         "channel_ids": [
@@ -42,8 +47,98 @@ BAIT_CONFIGS = {
     },
 }
 
+BAIT_CONFIGS = dict(DEFAULT_BAIT_CONFIGS)
+
 BAN_REASON = "Detected bot/scammer in bait channel"
 
+# Number of bait hits handled concurrently
+BAIT_WORKERS = 4
+
+# Seconds to wait before unbanning, so the 7 day message cleanup can finish
+UNBAN_DELAY = 2
+
+# Seconds to collect log embeds before sending them
+LOG_FLUSH_DELAY = 1.5
+
+# Discord limits a message to 10 embeds with 6000 characters between them
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Account age buckets in days; only accounts younger than the last bucket count
+# towards raid detection
+ACCOUNT_AGE_BUCKETS = (1, 7, 30)
+
+# Raid mode trips when this many new accounts hit bait channels within the window
+RAID_WINDOW = 10
+RAID_THRESHOLD = 5
+
+# Seconds raid mode stays active after the last new account hit
+RAID_COOLDOWN = 60
+
+# Seconds to collect raid accounts before sending a bulk ban (up to 200 per call)
+RAID_BATCH_DELAY = 2
+BULK_BAN_LIMIT = 200
+
+
+async def seed_bait_configs(bot):
+    for name, config in DEFAULT_BAIT_CONFIGS.items():
+        await bot.database.seed_channel_config("bait", name, config)
+
+
+async def load_bait_configs(bot):
+    configs = await bot.database.get_channel_configs("bait")
+    BAIT_CONFIGS.clear()
+    BAIT_CONFIGS.update(configs)
+
+
+def account_age_bucket(user):
+    age_days = (discord.utils.utcnow() - user.created_at).total_seconds() / 86400
+    for bucket, max_days in enumerate(ACCOUNT_AGE_BUCKETS):
+        if age_days < max_days:
+            return bucket
+    return None
+
+
+def chunk_embeds(embeds):
+    chunk = []
+    size = 0
+    for embed in embeds:
+        length = len(embed)
+        if chunk and (
+            len(chunk) >= MAX_EMBEDS_PER_MESSAGE
+            or size + length > MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            yield chunk
+            chunk = []
+            size = 0
+        chunk.append(embed)
+        size += length
+    if chunk:
+        yield chunk
+
+
+class RecentAccounts:
+    """
+    The distinct account IDs seen within the last `window` seconds, so one
+    account posting repeatedly only counts once.
+    """
+
+    __slots__ = ("seen", "window")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.seen = OrderedDict()
+
+    def hit(self, user_id: int, now: float):
+        self.seen[user_id] = now
+        self.seen.move_to_end(user_id)
+
+    def count(self, now: float) -> int:
+        cutoff = now - self.window
+        while self.seen and next(iter(self.seen.values())) <= cutoff:
+            self.seen.popitem(last=False)
+        return len(self.seen)
+
 
 def has_protected_role():
     async def predicate(context: Context):
@@ -181,37 +276,78 @@ def baitbot_command():
 
 
 class BaitBotListener(commands.Cog):
+    config_kind = "bait"
+    configs = BAIT_CONFIGS
+
     def __init__(self, bot):
         self.bot = bot
+        self.channel_index = build_channel_index(BAIT_CONFIGS)
+        self.actions = asyncio.Queue()
+        self.workers = []
+        self.background_tasks = set()
+        self.timers = {}
+        self.pending_logs = {}
+        self.raid_counters = {}
+        self.raid_until = {}
+        self.raid_batches = {}
+
+    async def cog_load(self):
+        self.workers = [
+            self.bot.loop.create_task(self.run_worker()) for _ in range(BAIT_WORKERS)
+        ]
+        if self.bot.database is not None:
+            await seed_bait_configs(self.bot)
+        await self.reload_configs()
+
+    async def cog_unload(self):
+        for worker in self.workers:
+            worker.cancel()
+        self.workers = []
+
+        # Run pending unbans and log flushes now instead of dropping them
+        pending = list(self.timers.items())
+        self.timers.clear()
+        for handle, _ in pending:
+            handle.cancel()
+        await asyncio.gather(
+            *(function(*args) for _, (function, args) in pending),
+            return_exceptions=True,
+        )
+
+    async def reload_configs(self):
+        if self.bot.database is not None:
+            await load_bait_configs(self.bot)
+        self.channel_index = build_channel_index(BAIT_CONFIGS)
+
+    def spawn(self, coroutine):
+        task = self.bot.loop.create_task(coroutine)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return task
+
+    def schedule(self, delay: float, function, *args):
+        def fire():
+            self.timers.pop(handle, None)
+            self.spawn(function(*args))
+
+        handle = self.bot.loop.call_later(delay, fire)
+        self.timers[handle] = (function, args)
+        return handle
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         if message.guild is None:
             return
 
-        if message.author.bot:
+        route = self.channel_index.get((message.guild.id, message.channel.id))
+        if route is None:
             return
 
-        bait_config = None
-        config_name = None
-        for name, config in BAIT_CONFIGS.items():
-            if message.guild.id != config.get("guild_id"):
-                continue
-
-            channel_ids = config.get("channel_ids", [])
-            if not channel_ids:
-                channel_id = config.get("channel_id")
-                if channel_id:
-                    channel_ids = [channel_id]
-
-            if message.channel.id in channel_ids:
-                bait_config = config
-                config_name = name
-                break
-
-        if not bait_config:
+        if message.author.bot:
             return
 
+        config_name, bait_config = route
+
         protected_role_id = bait_config.get("protected_role_id")
         is_protected = False
         if protected_role_id and hasattr(message.author, "roles"):
@@ -228,138 +364,299 @@ class BaitBotListener(commands.Cog):
                         is_protected = True
                         break
 
-        message_content = message.content if message.content else "*No text content*"
-        message_attachments = message.attachments
+        if not is_protected and self.record_hit(message.guild, message.author):
+            self.queue_raid_ban(config_name, bait_config, message)
+            return
+
+        self.actions.put_nowait((config_name, bait_config, message, is_protected))
+
+    def record_hit(self, guild: discord.Guild, user) -> bool:
+        now = time.monotonic()
+        if account_age_bucket(user) is not None:
+            accounts = self.raid_counters.get(guild.id)
+            if accounts is None:
+                accounts = RecentAccounts(RAID_WINDOW)
+                self.raid_counters[guild.id] = accounts
+            accounts.hit(user.id, now)
+
+            recent = accounts.count(now)
+            if recent >= RAID_THRESHOLD:
+                if self.raid_until.get(guild.id, 0) <= now:
+                    self.bot.logger.warning(
+                        f"[BAITBOT] Raid detected in {guild.name}: {recent} new accounts hit bait channels in {RAID_WINDOW}s, switching to bulk bans"
+                    )
+                self.raid_until[guild.id] = now + RAID_COOLDOWN
+
+        return self.raid_until.get(guild.id, 0) > now
+
+    async def run_worker(self):
+        while True:
+            config_name, bait_config, message, is_protected = await self.actions.get()
+            try:
+                await self.handle_bait_message(
+                    config_name, bait_config, message, is_protected
+                )
+            except Exception as e:
+                self.bot.logger.error(f"[BAITBOT] Error handling bait message: {e}")
+            finally:
+                self.actions.task_done()
 
+    async def delete_bait_message(self, message: discord.Message):
         try:
             await message.delete()
             self.bot.logger.info(
                 f"[BAITBOT] Deleted message from {message.author} in #{message.channel.name}"
             )
+        except discord.NotFound:
+            pass
         except Exception as e:
             self.bot.logger.warning(
                 f"[BAITBOT] Could not delete message from {message.author}: {e}"
             )
-        banned = False
+
+    async def ban_bait_author(self, message: discord.Message, config_name: str):
+        self.bot.logger.warning(
+            f"[BAITBOT] Detected user in bait channel [{config_name}]: {message.author.name} ({message.author.id}) in #{message.channel.name}"
+        )
+
+        if not message.guild.me.guild_permissions.ban_members:
+            self.bot.logger.error(
+                f"[BAITBOT] No permission to ban members in {message.guild.name}"
+            )
+            return False
+
+        try:
+            await message.author.ban(reason=BAN_REASON, delete_message_days=7)
+            self.bot.logger.info(
+                f"[BAITBOT] Banned {message.author.name} - deleted messages from last 7 days"
+            )
+            return True
+        except discord.Forbidden:
+            self.bot.logger.error(
+                f"[BAITBOT] Could not ban {message.author.name}: missing permissions"
+            )
+        except Exception as e:
+            self.bot.logger.error(f"[BAITBOT] Error banning {message.author.name}: {e}")
+        return False
+
+    async def unban_bait_author(self, guild: discord.Guild, user):
+        try:
+            await guild.unban(user, reason="Auto-unban after cleanup")
+            self.bot.logger.info(f"[BAITBOT] Unbanned {user.name} - cleanup complete")
+        except Exception as e:
+            self.bot.logger.error(f"[BAITBOT] Error unbanning {user.name}: {e}")
+
+    async def handle_bait_message(
+        self, config_name, bait_config, message: discord.Message, is_protected: bool
+    ):
+        steps = [self.delete_bait_message(message)]
         if not is_protected:
+            steps.append(self.ban_bait_author(message, config_name))
+        results = await asyncio.gather(*steps, return_exceptions=True)
+        banned = len(results) > 1 and results[1] is True
+
+        if banned:
+            self.schedule(
+                UNBAN_DELAY, self.unban_bait_author, message.guild, message.author
+            )
+
+        log_channel_id = bait_config.get("log_channel_id")
+        if log_channel_id:
+            self.queue_log(
+                log_channel_id, self.build_log_embed(message, banned, is_protected)
+            )
+
+    def build_log_embed(self, message: discord.Message, banned, is_protected):
+        message_content = message.content if message.content else "*No text content*"
+        action_text = (
+            "Message deleted (user banned and unbanned)"
+            if banned
+            else "Message deleted (protected user)"
+            if is_protected
+            else "Message deleted"
+        )
+        log_embed = discord.Embed(
+            title="Bait Bot",
+            description=action_text,
+            color=0xE02B2B,
+            timestamp=message.created_at,
+        )
+        log_embed.set_author(
+            name=str(message.author),
+            icon_url=message.author.display_avatar.url,
+        )
+        log_embed.add_field(name="User", value=message.author.mention, inline=True)
+        log_embed.add_field(name="Channel", value=message.channel.mention, inline=True)
+
+        combined_content = []
+        if message_content and message_content != "*No text content*":
+            combined_content.append(message_content)
+
+        image_url = None
+        for attachment in message.attachments:
+            if attachment.content_type and attachment.content_type.startswith("image/"):
+                if not image_url:
+                    image_url = attachment.url
+            combined_content.append(attachment.filename)
+
+        content_text = (
+            "\n".join(combined_content) if combined_content else "*No content*"
+        )
+        if len(content_text) > 1000:
+            content_text = content_text[:997] + "..."
+
+        log_embed.add_field(
+            name="Content", value=f"```\n{content_text}\n```", inline=False
+        )
+
+        if image_url:
+            log_embed.set_image(url=image_url)
+
+        log_embed.set_footer(text=f"Message ID: {message.id}")
+        return log_embed
+
+    def queue_log(self, log_channel_id: int, embed: discord.Embed):
+        pending = self.pending_logs.get(log_channel_id)
+        if pending is None:
+            self.pending_logs[log_channel_id] = [embed]
+            self.schedule(LOG_FLUSH_DELAY, self.flush_logs, log_channel_id)
+        else:
+            pending.append(embed)
+
+    async def flush_logs(self, log_channel_id: int):
+        embeds = self.pending_logs.pop(log_channel_id, [])
+        if not embeds:
+            return
+
+        log_channel = self.bot.get_channel(log_channel_id)
+        if not log_channel:
+            self.bot.logger.warning(f"[BAITBOT] Log channel {log_channel_id} not found")
+            return
+
+        for chunk in chunk_embeds(embeds):
             try:
+                await log_channel.send(embeds=chunk)
+                self.bot.logger.info(f"[BAITBOT] Sent log to #{log_channel.name}")
+                continue
+            except discord.Forbidden:
+                self.bot.logger.error(
+                    f"[BAITBOT] No permission to send log to #{log_channel.name}"
+                )
+                return
+            except discord.HTTPException as e:
+                if len(chunk) == 1:
+                    self.bot.logger.error(f"[BAITBOT] Error sending log: {e}")
+                    continue
                 self.bot.logger.warning(
-                    f"[BAITBOT] Detected user in bait channel [{config_name}]: {message.author.name} ({message.author.id}) in #{message.channel.name}"
+                    f"[BAITBOT] Error sending {len(chunk)} logs together, sending them one by one: {e}"
                 )
 
-                if not message.guild.me.guild_permissions.ban_members:
-                    self.bot.logger.error(
-                        f"[BAITBOT] No permission to ban members in {message.guild.name}"
+            for embed in chunk:
+                try:
+                    await log_channel.send(embed=embed)
+                except discord.HTTPException as e:
+                    self.bot.logger.error(f"[BAITBOT] Error sending log: {e}")
+
+    def queue_raid_ban(self, config_name, bait_config, message: discord.Message):
+        batch = self.raid_batches.get(message.guild.id)
+        if batch is None:
+            batch = {
+                "guild": message.guild,
+                "config_name": config_name,
+                "bait_config": bait_config,
+                "log_channel_id": bait_config.get("log_channel_id"),
+                "messages": {},
+            }
+            self.raid_batches[message.guild.id] = batch
+            self.schedule(RAID_BATCH_DELAY, self.flush_raid_bans, message.guild.id)
+        batch["messages"].setdefault(message.author.id, []).append(message)
+
+    async def flush_raid_bans(self, guild_id: int):
+        batch = self.raid_batches.pop(guild_id, None)
+        if not batch:
+            return
+
+        guild = batch["guild"]
+        messages = batch["messages"]
+        users = [user_messages[0].author for user_messages in messages.values()]
+        banned = []
+        failed = list(users)
+
+        permissions = guild.me.guild_permissions
+        if permissions.ban_members and permissions.manage_guild:
+            failed = []
+            for start in range(0, len(users), BULK_BAN_LIMIT):
+                chunk = users[start : start + BULK_BAN_LIMIT]
+                try:
+                    result = await guild.bulk_ban(
+                        chunk, reason=BAN_REASON, delete_message_seconds=604800
                     )
-                else:
-                    try:
-                        await message.author.ban(
-                            reason=BAN_REASON, delete_message_days=7
-                        )
-                        self.bot.logger.info(
-                            f"[BAITBOT] Banned {message.author.name} - deleted messages from last 7 days"
-                        )
-                        banned = True
-                    except discord.Forbidden:
-                        self.bot.logger.error(
-                            f"[BAITBOT] Could not ban {message.author.name}: missing permissions"
-                        )
-                    except Exception as e:
-                        self.bot.logger.error(
-                            f"[BAITBOT] Error banning {message.author.name}: {e}"
-                        )
+                    banned.extend(result.banned)
+                    failed.extend(result.failed)
+                except discord.HTTPException as e:
+                    self.bot.logger.error(f"[BAITBOT] Error bulk banning: {e}")
+                    failed.extend(chunk)
+            self.bot.logger.info(
+                f"[BAITBOT] Bulk banned {len(banned)} accounts in {guild.name} ({len(failed)} failed)"
+            )
+        else:
+            self.bot.logger.warning(
+                f"[BAITBOT] Bulk bans need Ban Members and Manage Server in {guild.name}, banning accounts one by one"
+            )
 
-                    if banned:
-                        await asyncio.sleep(2)
-                        try:
-                            await message.guild.unban(
-                                message.author, reason="Auto-unban after cleanup"
-                            )
-                            self.bot.logger.info(
-                                f"[BAITBOT] Unbanned {message.author.name} - cleanup complete"
-                            )
-                        except Exception as e:
-                            self.bot.logger.error(
-                                f"[BAITBOT] Error unbanning {message.author.name}: {e}"
-                            )
-            except Exception as e:
-                self.bot.logger.error(f"[BAITBOT] Error handling bait message: {e}")
+        if banned:
+            authors = [messages[user.id][0].author for user in banned]
+            self.schedule(UNBAN_DELAY, self.unban_raid_accounts, guild, authors)
 
-        log_channel_id = bait_config.get("log_channel_id")
-        if log_channel_id:
-            try:
-                log_channel = self.bot.get_channel(log_channel_id)
-                if log_channel:
-                    action_text = (
-                        "Message deleted (user banned and unbanned)"
-                        if banned
-                        else "Message deleted (protected user)"
-                        if is_protected
-                        else "Message deleted"
-                    )
-                    log_embed = discord.Embed(
-                        title="Bait Bot",
-                        description=action_text,
-                        color=0xE02B2B,
-                        timestamp=message.created_at,
-                    )
-                    log_embed.set_author(
-                        name=str(message.author),
-                        icon_url=message.author.display_avatar.url,
-                    )
-                    log_embed.add_field(
-                        name="User", value=message.author.mention, inline=True
-                    )
-                    log_embed.add_field(
-                        name="Channel", value=message.channel.mention, inline=True
-                    )
+        # Accounts the bulk ban missed go through the regular softban path
+        for user in failed:
+            for message in messages.get(user.id, []):
+                self.actions.put_nowait(
+                    (batch["config_name"], batch["bait_config"], message, False)
+                )
 
-                    combined_content = []
-                    if message_content and message_content != "*No text content*":
-                        combined_content.append(message_content)
-
-                    image_url = None
-                    if message_attachments:
-                        for attachment in message_attachments:
-                            if (
-                                attachment.content_type
-                                and attachment.content_type.startswith("image/")
-                            ):
-                                if not image_url:
-                                    image_url = attachment.url
-                            combined_content.append(attachment.filename)
-
-                    content_text = (
-                        "\n".join(combined_content)
-                        if combined_content
-                        else "*No content*"
-                    )
-                    if len(content_text) > 1000:
-                        content_text = content_text[:997] + "..."
+        if batch["log_channel_id"]:
+            self.queue_log(
+                batch["log_channel_id"],
+                self.build_raid_embed(guild, messages, banned, failed),
+            )
 
-                    log_embed.add_field(
-                        name="Content", value=f"```\n{content_text}\n```", inline=False
-                    )
+    async def unban_raid_accounts(self, guild: discord.Guild, users):
+        await asyncio.gather(
+            *(self.unban_bait_author(guild, user) for user in users),
+            return_exceptions=True,
+        )
 
-                    if image_url:
-                        log_embed.set_image(url=image_url)
+    def build_raid_embed(self, guild: discord.Guild, messages, banned, failed):
+        log_embed = discord.Embed(
+            title="Bait Bot",
+            description=f"Raid detected: {len(banned)} accounts banned and unbanned, {len(failed)} handled individually",
+            color=0xE02B2B,
+            timestamp=discord.utils.utcnow(),
+        )
+        log_embed.set_author(
+            name="Events", icon_url="https://yes.nighty.works/raw/C8Hh6o.png"
+        )
 
-                    log_embed.set_footer(text=f"Message ID: {message.id}")
+        channels = {
+            message.channel.mention
+            for user_messages in messages.values()
+            for message in user_messages
+        }
+        log_embed.add_field(name="Channels", value=" ".join(channels), inline=False)
+
+        banned_text = " ".join(f"<@{user.id}>" for user in banned) or "None"
+        if len(banned_text) > 1024:
+            banned_text = banned_text[:1021] + "..."
+        log_embed.add_field(name="Banned", value=banned_text, inline=False)
+
+        if failed:
+            failed_text = " ".join(f"<@{user.id}>" for user in failed)
+            if len(failed_text) > 1024:
+                failed_text = failed_text[:1021] + "..."
+            log_embed.add_field(
+                name="Handled Individually", value=failed_text, inline=False
+            )
 
-                    try:
-                        await log_channel.send(embed=log_embed)
-                        self.bot.logger.info(
-                            f"[BAITBOT] Sent log to #{log_channel.name}"
-                        )
-                    except discord.Forbidden:
-                        self.bot.logger.error(
-                            f"[BAITBOT] No permission to send log to #{log_channel.name}"
-                        )
-                    except Exception as e:
-                        self.bot.logger.error(f"[BAITBOT] Error sending log: {e}")
-                else:
-                    self.bot.logger.warning(
-                        f"[BAITBOT] Log channel {log_channel_id} not found"
-                    )
-            except Exception as e:
-                self.bot.logger.error(f"[BAITBOT] Error handling log channel: {e}")
+        log_embed.set_footer(text=f"Server ID: {guild.id}")
+        return log_embed
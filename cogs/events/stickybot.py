@@ -2,9 +2,15 @@ import discord
 from discord.ext import commands
 from discord.ext.commands import Context
 import asyncio
+import heapq
+
+import aiosqlite
+
+from utils.routing import build_channel_index
 
 # Make a pr to add your own server config here, you shouldn't need to touch the rest of the file, please fill in all the values for your own server
-STICKY_CONFIGS = {
+# These are seeded into the database once, the first time the bot starts with them, after that use `.events stickybot add/remove` to change the channels
+DEFAULT_STICKY_CONFIGS = {
     "neotest": {
         "guild_id": 1069946178659160076,
         "channel_ids": [
@@ -27,6 +33,22 @@ STICKY_CONFIGS = {
     },
 }
 
+STICKY_CONFIGS = dict(DEFAULT_STICKY_CONFIGS)
+
+# Minimum number of seconds between two reposts in the same channel
+MIN_REPOST_INTERVAL = 15
+
+
+async def seed_sticky_configs(bot):
+    for name, config in DEFAULT_STICKY_CONFIGS.items():
+        await bot.database.seed_channel_config("sticky", name, config)
+
+
+async def load_sticky_configs(bot):
+    configs = await bot.database.get_channel_configs("sticky")
+    STICKY_CONFIGS.clear()
+    STICKY_CONFIGS.update(configs)
+
 
 def has_allowed_role():
     async def predicate(context: Context):
@@ -161,21 +183,49 @@ def stickybot_command():
 
 
 class StickyBotListener(commands.Cog):
+    config_kind = "sticky"
+    configs = STICKY_CONFIGS
+
     def __init__(self, bot):
         self.bot = bot
         self.last_sticky_messages = {}
-        self.debounce_tasks = {}
+        self.sticky_contents = {}
+        self.channel_index = build_channel_index(STICKY_CONFIGS)
+        self.pending_reposts = {}
+        self.repost_heap = []
+        self.last_reposts = {}
+        self.reposting = set()
+        self.scheduler_wakeup = asyncio.Event()
+        self.scheduler_task = None
+        self.repost_tasks = set()
+
+    async def cog_load(self):
+        self.scheduler_task = self.bot.loop.create_task(self.run_scheduler())
+        if self.bot.database is not None:
+            await seed_sticky_configs(self.bot)
+        await self.reload_configs()
+        if self.bot.database is not None:
+            try:
+                self.last_sticky_messages.update(
+                    await self.bot.database.get_sticky_messages()
+                )
+            except aiosqlite.Error as e:
+                self.bot.logger.warning(
+                    f"[STICKYBOT] Could not load stored sticky messages: {e}"
+                )
+
+    async def reload_configs(self):
+        if self.bot.database is not None:
+            await load_sticky_configs(self.bot)
+        self.channel_index = build_channel_index(STICKY_CONFIGS)
+
+    def get_config(self, guild_id, channel_id):
+        route = self.channel_index.get((guild_id, channel_id))
+        return route[1] if route else None
 
     async def delete_last_sticky(self, channel):
         try:
-            active_config = None
-            for config in STICKY_CONFIGS.values():
-                if channel.guild.id == config.get(
-                    "guild_id"
-                ) and channel.id in config.get("channel_ids", []):
-                    active_config = config
-                    break
-
+            active_config = self.get_config(channel.guild.id, channel.id)
             if not active_config:
                 return
 
@@ -183,12 +233,23 @@ class StickyBotListener(commands.Cog):
                 "footer", "This is an automated sticky message."
             )
 
-            async for message in channel.history(limit=20):
-                if (
-                    message.author.id == self.bot.user.id
-                    and target_footer in message.content
-                ):
-                    await message.delete()
+            stale = [
+                message
+                async for message in channel.history(limit=20)
+                if message.author.id == self.bot.user.id
+                and target_footer in message.content
+            ]
+            if not stale:
+                return
+
+            try:
+                await channel.delete_messages(stale)
+            except discord.HTTPException:
+                for message in stale:
+                    try:
+                        await message.delete()
+                    except discord.NotFound:
+                        pass
         except Exception as e:
             self.bot.logger.warning(
                 f"[STICKYBOT] Error cleaning up sticky in #{channel.name}: {e}"
@@ -198,12 +259,39 @@ class StickyBotListener(commands.Cog):
         if not channel:
             return
 
+        message_content = config.get("message")
+        footer_text = config.get("footer", "This is an automated sticky message.")
+        full_content = (
+            f"{message_content}\n-# {footer_text}" if message_content else None
+        )
+
         last_msg_id = self.last_sticky_messages.get(channel.id)
+        if (
+            full_content
+            and last_msg_id
+            and getattr(channel, "last_message_id", None) == last_msg_id
+        ):
+            # Nothing was posted below the sticky, so keep it and only edit it if the text changed
+            if self.sticky_contents.get(channel.id) == full_content:
+                return
+            try:
+                await channel.get_partial_message(last_msg_id).edit(
+                    content=full_content,
+                    allowed_mentions=discord.AllowedMentions.none(),
+                )
+                self.sticky_contents[channel.id] = full_content
+                return
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                self.bot.logger.warning(
+                    f"[STICKYBOT] Error editing sticky in #{channel.name}: {e}"
+                )
+
         deleted = False
         if last_msg_id:
             try:
-                old_msg = await channel.fetch_message(last_msg_id)
-                await old_msg.delete()
+                await channel.get_partial_message(last_msg_id).delete()
                 deleted = True
             except discord.NotFound:
                 deleted = True
@@ -219,19 +307,22 @@ class StickyBotListener(commands.Cog):
         if not deleted:
             await self.delete_last_sticky(channel)
 
-        message_content = config.get("message")
-        if not message_content:
+        if not full_content:
             return
 
-        footer_text = config.get("footer", "This is an automated sticky message.")
-        footer = f"\n-# {footer_text}"
-        full_content = f"{message_content}{footer}"
-
         try:
             new_msg = await channel.send(
                 full_content, allowed_mentions=discord.AllowedMentions.none()
             )
             self.last_sticky_messages[channel.id] = new_msg.id
+            self.sticky_contents[channel.id] = full_content
+            if self.bot.database is not None:
+                try:
+                    await self.bot.database.set_sticky_message(channel.id, new_msg.id)
+                except aiosqlite.Error as e:
+                    self.bot.logger.warning(
+                        f"[STICKYBOT] Could not store sticky message for #{channel.name}: {e}"
+                    )
         except discord.Forbidden:
             self.bot.logger.warning(
                 f"[STICKYBOT] Missing send permissions in #{channel.name}"
@@ -259,45 +350,84 @@ class StickyBotListener(commands.Cog):
                 if channel:
                     await self.send_sticky_message(channel, config)
 
+    async def cog_unload(self):
+        if self.scheduler_task is not None:
+            self.scheduler_task.cancel()
+        for task in self.repost_tasks:
+            task.cancel()
+
+    def schedule_repost(self, channel, config, delay):
+        loop = self.bot.loop
+        deadline = max(
+            loop.time() + delay,
+            self.last_reposts.get(channel.id, 0) + MIN_REPOST_INTERVAL,
+        )
+        is_new = channel.id not in self.pending_reposts
+        self.pending_reposts[channel.id] = (deadline, channel, config)
+        if is_new:
+            heapq.heappush(self.repost_heap, (deadline, channel.id))
+            if self.repost_heap[0][1] == channel.id:
+                self.scheduler_wakeup.set()
+
+    async def run_scheduler(self):
+        loop = self.bot.loop
+        while True:
+            self.scheduler_wakeup.clear()
+            now = loop.time()
+            while self.repost_heap and self.repost_heap[0][0] <= now:
+                deadline, channel_id = heapq.heappop(self.repost_heap)
+                pending = self.pending_reposts.get(channel_id)
+                if pending is None:
+                    continue
+                if channel_id in self.reposting:
+                    next_deadline = max(pending[0], now + 1)
+                    self.pending_reposts[channel_id] = (next_deadline, *pending[1:])
+                    heapq.heappush(self.repost_heap, (next_deadline, channel_id))
+                    continue
+                if pending[0] > deadline:
+                    heapq.heappush(self.repost_heap, (pending[0], channel_id))
+                    continue
+                del self.pending_reposts[channel_id]
+                self.last_reposts[channel_id] = now
+                self.reposting.add(channel_id)
+                task = loop.create_task(self.repost(pending[1], pending[2]))
+                self.repost_tasks.add(task)
+                task.add_done_callback(self.repost_tasks.discard)
+
+            timeout = self.repost_heap[0][0] - now if self.repost_heap else None
+            try:
+                await asyncio.wait_for(self.scheduler_wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    async def repost(self, channel, config):
+        try:
+            await self.send_sticky_message(channel, config)
+        except Exception:
+            self.bot.logger.exception(
+                f"[STICKYBOT] Error reposting sticky in #{channel.name}"
+            )
+        finally:
+            self.reposting.discard(channel.id)
+
     async def trigger_sticky(self, channel, guild):
         if not guild or not channel:
             return
 
-        active_config = None
-        for config in STICKY_CONFIGS.values():
-            if guild.id == config.get("guild_id"):
-                if channel.id in config.get("channel_ids", []):
-                    active_config = config
-                    break
-
+        active_config = self.get_config(guild.id, channel.id)
         if not active_config:
             return
 
-        channel_id = channel.id
-
-        if channel_id in self.debounce_tasks:
-            self.debounce_tasks[channel_id].cancel()
-
-        async def debounce_wrapper():
-            try:
-                delay = active_config.get("delay", 5)
-                await asyncio.sleep(delay)
-                await self.send_sticky_message(channel, active_config)
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                self.bot.logger.error(f"[STICKYBOT] Error in debounce task: {e}")
-            finally:
-                if self.debounce_tasks.get(channel_id) == asyncio.current_task():
-                    del self.debounce_tasks[channel_id]
-
-        self.debounce_tasks[channel_id] = self.bot.loop.create_task(debounce_wrapper())
+        self.schedule_repost(channel, active_config, active_config.get("delay", 10))
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         if message.guild is None or message.author.bot:
             return
 
+        if (message.guild.id, message.channel.id) not in self.channel_index:
+            return
+
         if message.id == self.last_sticky_messages.get(message.channel.id):
             return
 
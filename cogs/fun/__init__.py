@@ -9,6 +9,12 @@ from .minesweeper import minesweeper_command
 from .randomfact import randomfact_command
 from .rockpaperscissors import rps_command
 
+_coinflip = coinflip_command()
+_eightball = eightball_command()
+_minesweeper = minesweeper_command()
+_randomfact = randomfact_command()
+_rps = rps_command()
+
 
 @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
 @app_commands.allowed_installs(guilds=True, users=True)
@@ -76,7 +82,7 @@ class Fun(commands.GroupCog, name="fun"):
         name="coinflip", description="Make a coin flip, but give your bet before."
     )
     async def coinflip(self, context):
-        return await coinflip_command()(self, context)
+        return await _coinflip(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -84,26 +90,26 @@ class Fun(commands.GroupCog, name="fun"):
         description="Ask any question to the bot.",
     )
     async def eight_ball(self, context, *, question: str):
-        return await eightball_command()(self, context, question=question)
+        return await _eightball(self, context, question=question)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="minesweeper", description="Play a buttoned minesweeper mini-game."
     )
     async def minesweeper(self, context):
-        return await minesweeper_command()(self, context)
+        return await _minesweeper(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="randomfact", description="Get a random fact.")
     async def randomfact(self, context):
-        return await randomfact_command()(self, context)
+        return await _randomfact(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="rps", description="Play the rock paper scissors game against the bot."
     )
     async def rock_paper_scissors(self, context):
-        return await rps_command()(self, context)
+        return await _rps(self, context)
 
 
 async def setup(bot) -> None:
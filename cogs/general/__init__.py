@@ -1,13 +1,19 @@
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.ext.commands import Context
 
 from .ping import ping_command
 from .uptime import uptime_command
-from .serverinfo import serverinfo_command
+from .serverinfo import serverinfo_command, PRESENCE_COUNTS
 from .feedback import feedback_command
-from .userinfo import userinfo_command
+from .userinfo import userinfo_command, fetch_quest_data, shutdown_banner_executor
+
+_ping = ping_command()
+_uptime = uptime_command()
+_serverinfo = serverinfo_command()
+_userinfo = userinfo_command()
+_feedback = feedback_command()
 
 
 def _require_group_prefix(context: Context) -> bool:
@@ -28,6 +34,55 @@ class General(commands.GroupCog, name="general"):
         self.bot = bot
         super().__init__()
 
+    async def cog_load(self) -> None:
+        self.refresh_quest_data.start()
+
+    async def cog_unload(self) -> None:
+        self.refresh_quest_data.cancel()
+        shutdown_banner_executor()
+
+    @tasks.loop(hours=1.0)
+    async def refresh_quest_data(self) -> None:
+        try:
+            await fetch_quest_data(self.bot)
+        except Exception as e:
+            self.bot.logger.warning(f"Failed to refresh quest data: {e}")
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        for guild in self.bot.guilds:
+            PRESENCE_COUNTS.seed(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        PRESENCE_COUNTS.seed(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        PRESENCE_COUNTS.drop(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild) -> None:
+        PRESENCE_COUNTS.seed(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_unavailable(self, guild: discord.Guild) -> None:
+        PRESENCE_COUNTS.drop(guild)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member) -> None:
+        PRESENCE_COUNTS.add(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member) -> None:
+        PRESENCE_COUNTS.remove(member)
+
+    @commands.Cog.listener()
+    async def on_presence_update(
+        self, before: discord.Member, after: discord.Member
+    ) -> None:
+        PRESENCE_COUNTS.update(before, after)
+
     @commands.group(name="general", invoke_without_command=True)
     async def general_group(self, context: Context):
         embed = discord.Embed(
@@ -80,7 +135,7 @@ class General(commands.GroupCog, name="general"):
         description="Check if the bot is alive.",
     )
     async def ping(self, context):
-        return await ping_command()(self, context)
+        return await _ping(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -88,7 +143,7 @@ class General(commands.GroupCog, name="general"):
         description="Check how long the bot has been running.",
     )
     async def uptime(self, context):
-        return await uptime_command()(self, context)
+        return await _uptime(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -96,7 +151,7 @@ class General(commands.GroupCog, name="general"):
         description="Get some useful (or not) information about the server.",
     )
     async def serverinfo(self, context):
-        return await serverinfo_command()(self, context)
+        return await _serverinfo(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -107,14 +162,14 @@ class General(commands.GroupCog, name="general"):
         user="User to get info for", user_id="User ID to get info for"
     )
     async def userinfo(self, context, user: discord.User = None, user_id: str = None):
-        return await userinfo_command()(self, context, user=user, user_id=user_id)
+        return await _userinfo(self, context, user=user, user_id=user_id)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="feedback", description="Submit a feedback for the owners of the bot"
     )
     async def feedback(self, context):
-        return await feedback_command()(self, context)
+        return await _feedback(self, context)
 
 
 async def setup(bot) -> None:
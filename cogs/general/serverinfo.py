@@ -1,7 +1,58 @@
+from collections import Counter
+
 import discord
 from discord.ext import commands
 
 
+class PresenceCounter:
+    """
+    Per-guild member status and bot counts, seeded with one pass over
+    ``guild.members`` and then kept current from gateway events.
+    """
+
+    def __init__(self) -> None:
+        self.guilds = {}
+
+    def seed(self, guild) -> Counter:
+        counts = Counter()
+        for member in guild.members:
+            counts[member.status] += 1
+            if member.bot:
+                counts["bot"] += 1
+        self.guilds[guild.id] = counts
+        return counts
+
+    def drop(self, guild) -> None:
+        self.guilds.pop(guild.id, None)
+
+    def get(self, guild) -> Counter:
+        counts = self.guilds.get(guild.id)
+        if counts is None:
+            counts = self.seed(guild)
+        return counts
+
+    def add(self, member, delta: int = 1) -> None:
+        counts = self.guilds.get(member.guild.id)
+        if counts is None:
+            return
+        counts[member.status] += delta
+        if member.bot:
+            counts["bot"] += delta
+
+    def remove(self, member) -> None:
+        self.add(member, -1)
+
+    def update(self, before, after) -> None:
+        counts = self.guilds.get(after.guild.id)
+        if counts is None or before.status == after.status:
+            return
+        counts[before.status] -= 1
+        counts[after.status] += 1
+
+
+PRESENCE_COUNTS = PresenceCounter()
+
+
 def serverinfo_command():
     @commands.hybrid_command(
         name="serverinfo",
@@ -61,18 +112,13 @@ def serverinfo_command():
             [s for s in guild.stickers if s.format == discord.StickerFormatType.lottie]
         )
 
-        online_members = len(
-            [m for m in guild.members if m.status == discord.Status.online]
-        )
-        idle_members = len(
-            [m for m in guild.members if m.status == discord.Status.idle]
-        )
-        dnd_members = len([m for m in guild.members if m.status == discord.Status.dnd])
-        offline_members = len(
-            [m for m in guild.members if m.status == discord.Status.offline]
-        )
+        presence = PRESENCE_COUNTS.get(guild)
+        online_members = presence[discord.Status.online]
+        idle_members = presence[discord.Status.idle]
+        dnd_members = presence[discord.Status.dnd]
+        offline_members = presence[discord.Status.offline]
 
-        bot_count = len([m for m in guild.members if m.bot])
+        bot_count = presence["bot"]
         human_count = guild.member_count - bot_count
 
         created_delta = discord.utils.utcnow() - guild.created_at
@@ -1,16 +1,67 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
-from PIL import Image
 from datetime import datetime, timezone
 
+from utils.banner import banner_needs_render, render_banner
+from utils.cache import TTLCache, cache_path, read_cache_file, write_cache_file
+
 ONE_MONTH = 2628000
 
-quests_fetch = 0
 quest_data = []
 
+# Seconds raw user and application payloads are reused for
+USER_DATA_TTL = 60
+APPLICATION_DATA_TTL = 300
+
+USER_DATA_CACHE = TTLCache(maxsize=256, ttl=USER_DATA_TTL)
+APPLICATION_DATA_CACHE = TTLCache(maxsize=128, ttl=APPLICATION_DATA_TTL)
+
+# Size banners are downloaded at for rendering, instead of the full 4096; large
+# enough that banners already 1100px wide are linked directly instead
+BANNER_SOURCE_SIZE = 2048
+
+# Worker processes for banner rendering, and seconds to wait for one
+BANNER_WORKERS = 2
+BANNER_RENDER_TIMEOUT = 10
+
+
+# Disk space rendered banners may use, in bytes; the oldest files are dropped first
+BANNER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+BANNER_EXECUTOR = None
+
+# Banners that need no rendering; rendered bytes live only in the disk cache
+BANNER_SKIP_CACHE = TTLCache(maxsize=1024, ttl=86400)
+
+
+def get_banner_executor() -> ProcessPoolExecutor:
+    global BANNER_EXECUTOR
+    if BANNER_EXECUTOR is None:
+        BANNER_EXECUTOR = ProcessPoolExecutor(
+            max_workers=BANNER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return BANNER_EXECUTOR
+
+
+def shutdown_banner_executor(*, terminate: bool = False) -> None:
+    global BANNER_EXECUTOR
+    executor, BANNER_EXECUTOR = BANNER_EXECUTOR, None
+    if executor is None:
+        return
+    # A timed out render keeps its worker busy until the process is killed
+    processes = list((executor._processes or {}).values()) if terminate else []
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
 ACTIVITY_TYPE_NAMES = [
     "Playing",
     "Streaming",
@@ -122,53 +173,105 @@ def snowflake_to_timestamp(snowflake):
     return ((int(snowflake) >> 22) + 1420070400000) / 1000
 
 
-async def fetch_quest_data():
-    global quests_fetch, quest_data
-
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            "https://raw.githubusercontent.com/aamiaa/discord-api-diff/refs/heads/main/quests.json"
-        ) as resp:
-            quest_data = await resp.json()
+async def fetch_quest_data(bot):
+    global quest_data
 
-    quests_fetch = int(datetime.now().timestamp() * 1000) + 3600000
+    async with bot.http_client.get(
+        "https://raw.githubusercontent.com/aamiaa/discord-api-diff/refs/heads/main/quests.json"
+    ) as resp:
+        if resp.status == 200:
+            quest_data = await resp.json(content_type=None)
 
 
 async def get_user_data(bot, user_id):
+    cached = USER_DATA_CACHE.get(user_id)
+    if cached is not None:
+        return cached
+
     headers = {"Authorization": f"Bot {bot.http.token}"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"https://discord.com/api/v10/users/{user_id}", headers=headers
-        ) as resp:
-            if resp.status == 404:
-                return None
-            return await resp.json()
+    async with bot.http_client.get(
+        f"https://discord.com/api/v10/users/{user_id}", headers=headers
+    ) as resp:
+        if resp.status != 200:
+            return None
+        user_data = await resp.json()
+
+    USER_DATA_CACHE.set(user_id, user_data)
+    return user_data
 
 
 async def get_application_data(bot, app_id):
+    cached = APPLICATION_DATA_CACHE.get(app_id)
+    if cached is not None:
+        return cached
+
     headers = {"Authorization": f"Bot {bot.http.token}"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"https://discord.com/api/v10/applications/{app_id}/rpc", headers=headers
-        ) as resp:
-            if resp.status in [404, 403, 10002]:
-                return None
-            return await resp.json()
+    async with bot.http_client.get(
+        f"https://discord.com/api/v10/applications/{app_id}/rpc", headers=headers
+    ) as resp:
+        if resp.status != 200:
+            return None
+        app_data = await resp.json()
+
+    APPLICATION_DATA_CACHE.set(app_id, app_data)
+    return app_data
 
 
 async def get_published_listing(bot, sku_id):
     headers = {"Authorization": f"Bot {bot.http.token}"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"https://discord.com/api/v10/store/published-listings/skus/{sku_id}",
-            headers=headers,
-        ) as resp:
+    async with bot.http_client.get(
+        f"https://discord.com/api/v10/store/published-listings/skus/{sku_id}",
+        headers=headers,
+    ) as resp:
+        if resp.status != 200:
+            return None
+        return await resp.json()
+
+
+async def get_banner_image(bot, user_id, banner_hash):
+    key = (user_id, banner_hash)
+    if key in BANNER_SKIP_CACHE:
+        return None
+
+    is_animated = banner_hash.startswith("a_")
+    ext = "gif" if is_animated else "png"
+    path = cache_path("banners", f"{user_id}:{banner_hash}", f".{ext}")
+
+    banner = await asyncio.to_thread(read_cache_file, path)
+    if banner is None:
+        url = f"https://cdn.discordapp.com/banners/{user_id}/{banner_hash}.{ext}?size={BANNER_SOURCE_SIZE}"
+        async with bot.http_client.get(url) as resp:
             if resp.status != 200:
                 return None
-            return await resp.json()
+            banner_data = await resp.read()
+
+        if not banner_needs_render(banner_data):
+            BANNER_SKIP_CACHE.set(key, True)
+            return None
+
+        loop = asyncio.get_running_loop()
+        try:
+            banner = await asyncio.wait_for(
+                loop.run_in_executor(
+                    get_banner_executor(), render_banner, banner_data, is_animated
+                ),
+                BANNER_RENDER_TIMEOUT,
+            )
+        except TimeoutError:
+            shutdown_banner_executor(terminate=True)
+            raise
+        except BrokenProcessPool:
+            shutdown_banner_executor()
+            raise
+        if banner is None:
+            BANNER_SKIP_CACHE.set(key, True)
+            return None
+        await asyncio.to_thread(write_cache_file, path, banner, BANNER_CACHE_MAX_BYTES)
+
+    return banner, ext
 
 
 def userinfo_command():
@@ -187,12 +290,15 @@ def userinfo_command():
 
         if user_id:
             try:
-                target_user = await bot.fetch_user(int(user_id))
+                target_user, user_data = await asyncio.gather(
+                    bot.fetch_user(int(user_id)), get_user_data(bot, int(user_id))
+                )
             except:
                 await context.send("User not found.")
                 return
+        else:
+            user_data = await get_user_data(bot, target_user.id)
 
-        user_data = await get_user_data(bot, target_user.id)
         if not user_data:
             await context.send("Failed to fetch user data.")
             return
@@ -200,11 +306,27 @@ def userinfo_command():
         guild = context.guild
         member = guild.get_member(target_user.id) if guild else None
 
-        if int(datetime.now().timestamp() * 1000) > quests_fetch:
-            try:
-                await fetch_quest_data()
-            except:
-                pass
+        avatar_hash = user_data.get("avatar", "")
+        banner_hash = user_data.get("banner")
+        avatar_decoration = user_data.get("avatar_decoration_data")
+
+        async def skip():
+            return None
+
+        app_data, rendered_banner, _ = await asyncio.gather(
+            get_application_data(bot, target_user.id)
+            if user_data.get("bot")
+            else skip(),
+            get_banner_image(bot, target_user.id, banner_hash)
+            if banner_hash
+            else skip(),
+            get_published_listing(bot, avatar_decoration["sku_id"])
+            if avatar_decoration and avatar_decoration.get("sku_id")
+            else skip(),
+            return_exceptions=True,
+        )
+        if isinstance(app_data, BaseException):
+            app_data = None
 
         badges = []
         flags = user_data.get("public_flags", 0)
@@ -277,8 +399,6 @@ def userinfo_command():
                 f"[{BADGE_ICONS['early_supporter']}]({BADGE_URLS['early_supporter']})"
             )
 
-        avatar_hash = user_data.get("avatar", "")
-        banner_hash = user_data.get("banner")
         if (
             banner_hash or (avatar_hash and avatar_hash.startswith("a_"))
         ) and not user_data.get("bot"):
@@ -310,7 +430,6 @@ def userinfo_command():
 
         bot_deleted = False
         if user_data.get("bot"):
-            app_data = await get_application_data(bot, target_user.id)
             if app_data:
                 app_flags = app_data.get("flags", 0)
                 if app_flags & APPLICATION_FLAGS["APPLICATION_COMMAND_BADGE"]:
@@ -326,7 +445,6 @@ def userinfo_command():
                 bot_deleted = False
 
         quest_decoration_name = None
-        avatar_decoration = user_data.get("avatar_decoration_data")
         if avatar_decoration and avatar_decoration.get("sku_id"):
             for quest in quest_data:
                 config = quest.get("config", {})
@@ -406,86 +524,13 @@ def userinfo_command():
             original_banner_url = f"https://cdn.discordapp.com/banners/{target_user.id}/{banner_hash}.{ext}?size=4096"
             original_banner_link = original_banner_url
 
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(original_banner_url) as resp:
-                        if resp.status == 200:
-                            banner_data = await resp.read()
-                            img = Image.open(BytesIO(banner_data))
-
-                            if img.width < 1100:
-                                target_width = 1100
-                                target_height = 440
-
-                                img_aspect = img.width / img.height
-                                target_aspect = target_width / target_height
-
-                                if img_aspect > target_aspect:
-                                    scale_height = target_height
-                                    scale_width = int(scale_height * img_aspect)
-                                else:
-                                    scale_width = target_width
-                                    scale_height = int(scale_width / img_aspect)
-
-                                left = (scale_width - target_width) // 2
-                                top = (scale_height - target_height) // 2
-                                right = left + target_width
-                                bottom = top + target_height
-
-                                if is_animated:
-                                    frames = []
-                                    durations = []
-
-                                    try:
-                                        while True:
-                                            frame = img.copy().convert("RGBA")
-                                            frame = frame.resize(
-                                                (scale_width, scale_height),
-                                                Image.Resampling.LANCZOS,
-                                            )
-                                            frame = frame.crop(
-                                                (left, top, right, bottom)
-                                            )
-                                            frames.append(frame)
-                                            durations.append(
-                                                img.info.get("duration", 100)
-                                            )
-                                            img.seek(img.tell() + 1)
-                                    except EOFError:
-                                        pass
-
-                                    output = BytesIO()
-                                    frames[0].save(
-                                        output,
-                                        format="GIF",
-                                        save_all=True,
-                                        append_images=frames[1:],
-                                        duration=durations,
-                                        loop=0,
-                                        optimize=False,
-                                    )
-                                    output.seek(0)
-                                    banner_file = discord.File(
-                                        output, filename="banner.gif"
-                                    )
-                                    banner_url = "attachment://banner.gif"
-                                else:
-                                    img = img.resize(
-                                        (scale_width, scale_height),
-                                        Image.Resampling.LANCZOS,
-                                    )
-                                    img = img.crop((left, top, right, bottom))
-
-                                    output = BytesIO()
-                                    img.save(output, format="PNG")
-                                    output.seek(0)
-                                    banner_file = discord.File(
-                                        output, filename="banner.png"
-                                    )
-                                    banner_url = "attachment://banner.png"
-                            else:
-                                banner_url = original_banner_url
-            except:
+            if rendered_banner and not isinstance(rendered_banner, BaseException):
+                banner_data, banner_ext = rendered_banner
+                banner_file = discord.File(
+                    BytesIO(banner_data), filename=f"banner.{banner_ext}"
+                )
+                banner_url = f"attachment://banner.{banner_ext}"
+            else:
                 banner_url = original_banner_url
 
         images = [f"[Avatar]({avatar_url})"]
@@ -494,7 +539,6 @@ def userinfo_command():
             images.append(f"[Banner]({original_banner_link})")
 
         if avatar_decoration:
-            await get_published_listing(bot, avatar_decoration["sku_id"])
             decoration_url = f"https://cdn.discordapp.com/avatar-decoration-presets/{avatar_decoration['asset']}.png?size=4096&passthrough=true"
             images.append(f"[Avatar Deco]({decoration_url})")
 
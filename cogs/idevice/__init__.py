@@ -9,6 +9,11 @@ from .developermode import developermode_command
 from .noapps import noapps_command
 from .mountddi import mountddi_command
 
+_errorcodes = errorcodes_command()
+_developermode = developermode_command()
+_noapps = noapps_command()
+_mountddi = mountddi_command()
+
 
 @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
 @app_commands.allowed_installs(guilds=True, users=True)
@@ -83,14 +88,14 @@ class Idevice(commands.GroupCog, name="idevice"):
         name="errorcodes", description="Look up error codes and their meanings."
     )
     async def errorcodes(self, context, *, error_code: str = None):
-        return await errorcodes_command()(self, context, name=error_code)
+        return await _errorcodes(self, context, name=error_code)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="developermode", description="How to turn on developer mode"
     )
     async def developermode(self, context):
-        return await developermode_command()(self, context)
+        return await _developermode(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -98,12 +103,12 @@ class Idevice(commands.GroupCog, name="idevice"):
         description="Help when apps aren't showing in installed apps view",
     )
     async def noapps(self, context):
-        return await noapps_command()(self, context)
+        return await _noapps(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="mountddi", description="How to manually mount DDI")
     async def mountddi(self, context):
-        return await mountddi_command()(self, context)
+        return await _mountddi(self, context)
 
 
 async def setup(bot) -> None:
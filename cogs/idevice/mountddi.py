@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
 import os
-import aiohttp
 import shutil
 import tempfile
 
@@ -55,23 +54,22 @@ def mountddi_command():
             base_url = "https://raw.githubusercontent.com/doronz88/DeveloperDiskImage/main/PersonalizedImages/Xcode_iOS_DDI_Personalized"
             files = ["BuildManifest.plist", "Image.dmg", "Image.dmg.trustcache"]
 
-            async with aiohttp.ClientSession() as session:
-                for filename in files:
-                    file_url = f"{base_url}/{filename}"
-                    async with session.get(file_url) as response:
-                        if response.status != 200:
-                            await context.send(
-                                f"Error: Failed to download {filename} (Status: {response.status})"
-                            )
-                            return
+            for filename in files:
+                file_url = f"{base_url}/{filename}"
+                async with self.bot.http_client.get(file_url) as response:
+                    if response.status != 200:
+                        await context.send(
+                            f"Error: Failed to download {filename} (Status: {response.status})"
+                        )
+                        return
 
-                        file_path = os.path.join(ddi_dir, filename)
-                        with open(file_path, "wb") as f:
-                            while True:
-                                chunk = await response.content.read(8192)
-                                if not chunk:
-                                    break
-                                f.write(chunk)
+                    file_path = os.path.join(ddi_dir, filename)
+                    with open(file_path, "wb") as f:
+                        while True:
+                            chunk = await response.content.read(8192)
+                            if not chunk:
+                                break
+                            f.write(chunk)
 
             zip_base_name = os.path.join(temp_dir, "DDI")
             shutil.make_archive(zip_base_name, "zip", root_dir=temp_dir, base_dir="DDI")
@@ -6,6 +6,8 @@ from discord.ext.commands import Context
 from .livecontainer import LivecontainerView
 from .jit26 import jit26_command
 
+_jit26 = jit26_command()
+
 
 @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
 @app_commands.allowed_installs(guilds=True, users=True)
@@ -82,7 +84,7 @@ class Livecontainer(commands.GroupCog, name="livecontainer"):
         name="26jit", description="Walkthrough for iOS 26 JIT and sideloading"
     )
     async def jit26(self, context):
-        return await jit26_command()(self, context)
+        return await _jit26(self, context)
 
 
 async def setup(bot) -> None:
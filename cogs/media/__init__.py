@@ -7,7 +7,12 @@ from typing import Optional
 from .mcquote import mcquote_command
 from .img2gif import img2gif_command
 from .tweety import tweety_command
-from .tts import tts_command
+from .tts import tts_command, shutdown_tts_executor
+
+_mcquote = mcquote_command()
+_img2gif = img2gif_command()
+_tweety = tweety_command()
+_tts = tts_command()
 
 
 def _require_group_prefix(context: Context) -> bool:
@@ -28,6 +33,9 @@ class Media(commands.GroupCog, name="media"):
         self.bot = bot
         super().__init__()
 
+    async def cog_unload(self) -> None:
+        shutdown_tts_executor()
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """Listen for bot mentions with 'tweety' command while replying to a message"""
@@ -106,7 +114,7 @@ class Media(commands.GroupCog, name="media"):
         description="Generate a custom Minecraft quote image.",
     )
     async def mcquote(self, context, *, text: str):
-        return await mcquote_command()(self, context, text=text)
+        return await _mcquote(self, context, text=text)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -114,7 +122,7 @@ class Media(commands.GroupCog, name="media"):
         description="Convert an uploaded image to a GIF.",
     )
     async def img2gif(self, context, attachment: Optional[discord.Attachment] = None):
-        return await img2gif_command()(self, context, attachment=attachment)
+        return await _img2gif(self, context, attachment=attachment)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -122,7 +130,7 @@ class Media(commands.GroupCog, name="media"):
         description="Convert a replied message to a tweet image.",
     )
     async def tweety(self, context):
-        return await tweety_command()(self, context)
+        return await _tweety(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -130,7 +138,7 @@ class Media(commands.GroupCog, name="media"):
         description="Convert text to speech using Google Text-to-Speech.",
     )
     async def tts(self, context, text: str = None):
-        return await tts_command()(context, text=text)
+        return await _tts(context, text=text)
 
 
 async def setup(bot) -> None:
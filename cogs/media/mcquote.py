@@ -145,10 +145,9 @@ def mcquote_command():
         mc_quote_url = f"https://skinmc.net/achievement/{random_number}/Achievement+Unlocked!/{quote_text}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(mc_quote_url) as response:
-                    response.raise_for_status()
-                    content = await response.read()
+            async with self.bot.http_client.get(mc_quote_url) as response:
+                response.raise_for_status()
+                content = await response.read()
 
             with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as temp_file:
                 temp_file.write(content)
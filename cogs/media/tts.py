@@ -1,5 +1,7 @@
 import asyncio
+import hashlib
 import io
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import discord
@@ -7,9 +9,78 @@ from discord import app_commands
 from discord.ext import commands
 from gtts import gTTS
 
+from utils.cache import TTLCache, cache_path, read_cache_file, write_cache_file
+
 
 DEFAULT_LANG = "en"
 
+# Threads reserved for gTTS so synthesis can't starve the default executor
+TTS_WORKERS = 2
+
+# Longest text (characters) whose audio is cached in memory and on disk
+TTS_CACHE_MAX_CHARS = 200
+
+# Disk space the cached audio may use, in bytes; the oldest files are dropped first
+TTS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+TTS_EXECUTOR = None
+TTS_CACHE = TTLCache(maxsize=64, ttl=86400)
+IN_FLIGHT_TTS = {}
+
+
+def get_tts_executor() -> ThreadPoolExecutor:
+    global TTS_EXECUTOR
+    if TTS_EXECUTOR is None:
+        TTS_EXECUTOR = ThreadPoolExecutor(
+            max_workers=TTS_WORKERS, thread_name_prefix="tts"
+        )
+    return TTS_EXECUTOR
+
+
+def shutdown_tts_executor() -> None:
+    global TTS_EXECUTOR
+    if TTS_EXECUTOR is not None:
+        TTS_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        TTS_EXECUTOR = None
+
+
+async def synthesize_cached(text: str, synthesize) -> bytes:
+    key = hashlib.sha256(f"{DEFAULT_LANG}:{text}".encode("utf-8")).hexdigest()
+    cacheable = len(text) <= TTS_CACHE_MAX_CHARS
+
+    if cacheable:
+        audio_bytes = TTS_CACHE.get(key)
+        if audio_bytes is not None:
+            return audio_bytes
+
+    task = IN_FLIGHT_TTS.get(key)
+    if task is None:
+
+        async def run() -> bytes:
+            path = cache_path("tts", key, ".mp3")
+            if cacheable:
+                audio_bytes = await asyncio.to_thread(read_cache_file, path)
+                if audio_bytes is not None:
+                    TTS_CACHE.set(key, audio_bytes)
+                    return audio_bytes
+
+            loop = asyncio.get_running_loop()
+            audio_bytes = await loop.run_in_executor(
+                get_tts_executor(), synthesize, text
+            )
+            if cacheable:
+                TTS_CACHE.set(key, audio_bytes)
+                await asyncio.to_thread(
+                    write_cache_file, path, audio_bytes, TTS_CACHE_MAX_BYTES
+                )
+            return audio_bytes
+
+        task = asyncio.ensure_future(run())
+        IN_FLIGHT_TTS[key] = task
+        task.add_done_callback(lambda _: IN_FLIGHT_TTS.pop(key, None))
+
+    return await asyncio.shield(task)
+
 
 def tts_command():
     async def send_embed(
@@ -45,10 +116,7 @@ def tts_command():
 
     async def generate_tts_audio(text: str) -> tuple[Optional[bytes], Optional[str]]:
         try:
-            loop = asyncio.get_event_loop()
-            audio_bytes = await loop.run_in_executor(
-                None, lambda: _generate_tts_sync(text)
-            )
+            audio_bytes = await synthesize_cached(text, _generate_tts_sync)
             return audio_bytes, None
         except Exception as e:
             return None, str(e)
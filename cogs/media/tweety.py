@@ -223,49 +223,48 @@ class TweetyView(discord.ui.View):
         self.last_regenerate_time = time.time()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/api/render",
-                    json=self.tweet_data,
-                    headers={"Content-Type": "application/json"},
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        embed = discord.Embed(
-                            title="Error",
-                            description=f"API Error ({response.status}): {error_text}",
-                            color=0xE02B2B,
-                        )
-                        embed.set_author(
-                            name="Media",
-                            icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
-                        )
-                        await interaction.followup.send(embed=embed, ephemeral=True)
-                        return
+            async with interaction.client.http_client.post(
+                f"{self.api_url}/api/render",
+                json=self.tweet_data,
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    embed = discord.Embed(
+                        title="Error",
+                        description=f"API Error ({response.status}): {error_text}",
+                        color=0xE02B2B,
+                    )
+                    embed.set_author(
+                        name="Media",
+                        icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
+                    )
+                    await interaction.followup.send(embed=embed, ephemeral=True)
+                    return
 
-                    image_data = await response.read()
+                image_data = await response.read()
 
-                    with tempfile.NamedTemporaryFile(
-                        delete=False, suffix=".png"
-                    ) as temp_file:
-                        temp_file.write(image_data)
-                        temp_file_path = temp_file.name
+                with tempfile.NamedTemporaryFile(
+                    delete=False, suffix=".png"
+                ) as temp_file:
+                    temp_file.write(image_data)
+                    temp_file_path = temp_file.name
 
-                    with open(temp_file_path, "rb") as f:
-                        author_name = self.original_message.author.name
-                        filename = (
-                            f"tweet_{author_name}_{int(datetime.now().timestamp())}.png"
-                        )
-                        file = discord.File(f, filename=filename)
+                with open(temp_file_path, "rb") as f:
+                    author_name = self.original_message.author.name
+                    filename = (
+                        f"tweet_{author_name}_{int(datetime.now().timestamp())}.png"
+                    )
+                    file = discord.File(f, filename=filename)
 
-                        self.update_button_styles()
+                    self.update_button_styles()
 
-                        if self.image_message is not None:
-                            await self.image_message.edit(attachments=[file], view=self)
-                        else:
-                            await interaction.followup.send(file=file, view=self)
+                    if self.image_message is not None:
+                        await self.image_message.edit(attachments=[file], view=self)
+                    else:
+                        await interaction.followup.send(file=file, view=self)
 
-                    os.remove(temp_file_path)
+                os.remove(temp_file_path)
 
         except Exception:
             embed = discord.Embed(
@@ -423,94 +422,93 @@ def tweety_command():
 
             API_BASE_URL = "http://tweet.6969.pro"
 
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.post(
-                        f"{API_BASE_URL}/api/render",
-                        json=tweet_data,
-                        headers={"Content-Type": "application/json"},
-                    ) as response:
-                        if response.status != 200:
-                            await processing_msg.delete()
-                            error_text = await response.text()
-                            embed = discord.Embed(
-                                title="Error",
-                                description=f"API Error ({response.status}): {error_text}",
-                                color=0xE02B2B,
-                            )
-                            embed.set_author(
-                                name="Media",
-                                icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
-                            )
-                            await context.send(embed=embed)
-                            return
-
-                        image_data = await response.read()
-
-                        with tempfile.NamedTemporaryFile(
-                            delete=False, suffix=".png"
-                        ) as temp_file:
-                            temp_file.write(image_data)
-                            temp_file_path = temp_file.name
-
+            try:
+                async with self.bot.http_client.post(
+                    f"{API_BASE_URL}/api/render",
+                    json=tweet_data,
+                    headers={"Content-Type": "application/json"},
+                ) as response:
+                    if response.status != 200:
                         await processing_msg.delete()
+                        error_text = await response.text()
+                        embed = discord.Embed(
+                            title="Error",
+                            description=f"API Error ({response.status}): {error_text}",
+                            color=0xE02B2B,
+                        )
+                        embed.set_author(
+                            name="Media",
+                            icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
+                        )
+                        await context.send(embed=embed)
+                        return
+
+                    image_data = await response.read()
+
+                    with tempfile.NamedTemporaryFile(
+                        delete=False, suffix=".png"
+                    ) as temp_file:
+                        temp_file.write(image_data)
+                        temp_file_path = temp_file.name
 
-                        with open(temp_file_path, "rb") as f:
-                            file = discord.File(
-                                f,
-                                filename=f"tweet_{author.name}_{int(datetime.now().timestamp())}.png",
-                            )
-                            embed = discord.Embed(
-                                title="Tweet Generated",
-                                description="<:error:1424007141768822824> Tweet sometimes may look a bit broken, im gonna rewrite the API another time... (it wasnt made for Syntrel in the first place)",
-                                color=0x7289DA,
-                            )
-                            embed.set_author(
-                                name="Media",
-                                icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
-                            )
-                            embed.set_footer(
-                                text=f"Requested by {context.author.name}",
-                                icon_url=context.author.display_avatar.url,
-                            )
-
-                            view = TweetyView(
-                                author_id=context.author.id,
-                                original_message=original_message,
-                                tweet_data=tweet_data,
-                                api_url=API_BASE_URL,
-                            )
-
-                            await context.send(embed=embed)
-                            image_message = await context.send(file=file, view=view)
-                            view.image_message = image_message
-
-                        os.remove(temp_file_path)
-
-                except aiohttp.ClientError:
-                    await processing_msg.delete()
-                    embed = discord.Embed(
-                        title="Error",
-                        description="Connection error: Could not reach tweet API",
-                        color=0xE02B2B,
-                    )
-                    embed.set_author(
-                        name="Media",
-                        icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
-                    )
-                    await context.send(embed=embed)
-                except Exception:
                     await processing_msg.delete()
-                    embed = discord.Embed(
-                        title="Error",
-                        description="Error generating tweet image",
-                        color=0xE02B2B,
-                    )
-                    embed.set_author(
-                        name="Media",
-                        icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
-                    )
-                    await context.send(embed=embed)
+
+                    with open(temp_file_path, "rb") as f:
+                        file = discord.File(
+                            f,
+                            filename=f"tweet_{author.name}_{int(datetime.now().timestamp())}.png",
+                        )
+                        embed = discord.Embed(
+                            title="Tweet Generated",
+                            description="<:error:1424007141768822824> Tweet sometimes may look a bit broken, im gonna rewrite the API another time... (it wasnt made for Syntrel in the first place)",
+                            color=0x7289DA,
+                        )
+                        embed.set_author(
+                            name="Media",
+                            icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
+                        )
+                        embed.set_footer(
+                            text=f"Requested by {context.author.name}",
+                            icon_url=context.author.display_avatar.url,
+                        )
+
+                        view = TweetyView(
+                            author_id=context.author.id,
+                            original_message=original_message,
+                            tweet_data=tweet_data,
+                            api_url=API_BASE_URL,
+                        )
+
+                        await context.send(embed=embed)
+                        image_message = await context.send(file=file, view=view)
+                        view.image_message = image_message
+
+                    os.remove(temp_file_path)
+
+            except aiohttp.ClientError:
+                await processing_msg.delete()
+                embed = discord.Embed(
+                    title="Error",
+                    description="Connection error: Could not reach tweet API",
+                    color=0xE02B2B,
+                )
+                embed.set_author(
+                    name="Media",
+                    icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
+                )
+                await context.send(embed=embed)
+            except Exception:
+                await processing_msg.delete()
+                embed = discord.Embed(
+                    title="Error",
+                    description="Error generating tweet image",
+                    color=0xE02B2B,
+                )
+                embed.set_author(
+                    name="Media",
+                    icon_url="https://yes.nighty.works/raw/y5SEZ9.webp",
+                )
+                await context.send(embed=embed)
 
         except Exception:
             embed = discord.Embed(
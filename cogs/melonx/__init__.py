@@ -13,6 +13,15 @@ from .error import error_command
 from .ios26 import ios26_command
 from .upgrade import upgrade_command
 
+_transfer = transfer_command()
+_mods = mods_command()
+_legal = legal_command()
+_crash = crash_command()
+_requirements = requirements_command()
+_error = error_command()
+_ios26 = ios26_command()
+_upgrade = upgrade_command()
+
 
 @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
 @app_commands.allowed_installs(guilds=True, users=True)
@@ -115,50 +124,50 @@ class Melonx(commands.GroupCog, name="melonx"):
         description="How to transfer save files from other emulators or platforms",
     )
     async def transfer(self, context):
-        return await transfer_command()(self, context)
+        return await _transfer(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="mods", description="How to install mods within MeloNX (Limited Support)"
     )
     async def mods(self, context):
-        return await mods_command()(self, context)
+        return await _mods(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="legal", description="Legality of emulators")
     async def legal(self, context):
-        return await legal_command()(self, context)
+        return await _legal(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="gamecrash", description="Why does my game crash?")
     async def gamecrash(self, context):
-        return await crash_command()(self, context)
+        return await _crash(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="requirements", description="What does MeloNX require?"
     )
     async def requirements(self, context):
-        return await requirements_command()(self, context)
+        return await _requirements(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="error", description="What does this error message mean?"
     )
     async def error(self, context):
-        return await error_command()(self, context)
+        return await _error(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="26", description="How can I run MeloNX on iOS 26?")
     async def ios26(self, context):
-        return await ios26_command()(self, context)
+        return await _ios26(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="upgrade", description="How can I upgrade my firmware and keys in MeloNX?"
     )
     async def upgrade(self, context):
-        return await upgrade_command()(self, context)
+        return await _upgrade(self, context)
 
 
 async def setup(bot) -> None:
@@ -17,6 +17,20 @@ from .sigma import sigma_command
 from .silly import silly_command
 from .color import color_command
 
+_dontasktoask = dontasktoask_command()
+_rr = rr_command()
+_depart = depart_command()
+_labubu = labubu_command()
+_duck = duck_command()
+_tryitandsee = tryitandsee_command()
+_piracy = piracy_command()
+_keanu = keanu_command()
+_support = support_command()
+_docs = docs_command()
+_sigma = sigma_command()
+_silly = silly_command()
+_color = color_command()
+
 
 @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
 @app_commands.allowed_installs(guilds=True, users=True)
@@ -118,57 +132,57 @@ class Miscellaneous(commands.GroupCog, name="misc"):
         name="dontasktoask", description="Shows the 'Don't Ask to Ask' image."
     )
     async def dontasktoask(self, context):
-        return await dontasktoask_command()(self, context)
+        return await _dontasktoask(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="rr", description="Rickroll")
     async def rr(self, context):
-        return await rr_command()(self, context)
+        return await _rr(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="depart", description="Show the departure meme")
     async def depart(self, context):
-        return await depart_command()(self, context)
+        return await _depart(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="labubu", description="Labubu ASCII art")
     async def labubu(self, context):
-        return await labubu_command()(self, context)
+        return await _labubu(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="duck", description="Duck ASCII art")
     async def duck(self, context):
-        return await duck_command()(self, context)
+        return await _duck(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="tryitandsee", description="Try it and see")
     async def tryitandsee(self, context):
-        return await tryitandsee_command()(self, context)
+        return await _tryitandsee(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="piracy", description="FBI Anti Piracy Warning")
     async def piracy(self, context):
-        return await piracy_command()(self, context)
+        return await _piracy(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="keanu", description="Reeves")
     async def keanu(self, context):
-        return await keanu_command()(self, context)
+        return await _keanu(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="support", description="Support?")
     async def support(self, context):
-        return await support_command()(self, context)
+        return await _support(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="docs", description="Shows the docs image.")
     async def docs(self, context):
-        return await docs_command()(self, context)
+        return await _docs(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="sigma", description="i feel so sigma!")
     async def sigma(self, context):
-        return await sigma_command()(self, context)
+        return await _sigma(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="silly", description="Sends a silly message :3")
@@ -180,12 +194,12 @@ class Miscellaneous(commands.GroupCog, name="misc"):
         ]
     )
     async def silly(self, context, message_type: str = "regular"):
-        return await silly_command()(self, context, message_type=message_type)
+        return await _silly(self, context, message_type=message_type)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="color", description="Get a random color.")
     async def color(self, context):
-        return await color_command()(self, context)
+        return await _color(self, context)
 
 
 async def setup(bot) -> None:
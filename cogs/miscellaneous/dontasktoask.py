@@ -1,6 +1,5 @@
 import discord
 from discord.ext import commands
-import aiohttp
 import io
 
 
@@ -11,9 +10,8 @@ def dontasktoask_command():
     async def dontasktoask(self, context):
         image_url = "https://yes.nighty.works/raw/KecbCr.jpg"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(image_url) as resp:
-                data = await resp.read()
+        async with self.bot.http_client.get(image_url) as resp:
+            data = await resp.read()
         file = discord.File(io.BytesIO(data), filename="dontasktoask.jpg")
 
         if getattr(context, "interaction", None):
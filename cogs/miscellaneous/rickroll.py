@@ -1,6 +1,5 @@
 import discord
 from discord.ext import commands
-import aiohttp
 import io
 
 
@@ -12,9 +11,8 @@ def rr_command():
     async def rr(self, context):
         gif_url = "https://yes.nighty.works/raw/JzjMcs.gif"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(gif_url) as resp:
-                data = await resp.read()
+        async with self.bot.http_client.get(gif_url) as resp:
+            data = await resp.read()
         file = discord.File(io.BytesIO(data), filename="rickroll.gif")
 
         if getattr(context, "interaction", None):
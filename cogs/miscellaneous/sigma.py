@@ -1,6 +1,5 @@
 import discord
 from discord.ext import commands
-import aiohttp
 import io
 
 
@@ -12,9 +11,8 @@ def sigma_command():
     async def sigma(self, context):
         image_url = "https://yes.nighty.works/raw/EpWodj.jpeg"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(image_url) as resp:
-                data = await resp.read()
+        async with self.bot.http_client.get(image_url) as resp:
+            data = await resp.read()
         file = discord.File(io.BytesIO(data), filename="sigma.png")
 
         if getattr(context, "interaction", None):
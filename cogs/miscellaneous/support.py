@@ -1,6 +1,5 @@
 import discord
 from discord.ext import commands
-import aiohttp
 import io
 
 
@@ -9,9 +8,8 @@ def support_command():
     async def support(self, context):
         url = "https://yes.nighty.works/raw/wGzHIV.gif"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                data = await resp.read()
+        async with self.bot.http_client.get(url) as resp:
+            data = await resp.read()
         file = discord.File(io.BytesIO(data), filename="support.gif")
 
         if getattr(context, "interaction", None):
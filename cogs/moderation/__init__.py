@@ -12,6 +12,18 @@ from .hackban import hackban_command
 from .nick import nick_command
 from .timeout import timeout_command
 
+_ban = ban_command()
+_kick = kick_command()
+_purge = purge_command()
+_warnings = warnings_command()
+_warnings_add = _warnings.get_command("add")
+_warnings_remove = _warnings.get_command("remove")
+_warnings_list = _warnings.get_command("list")
+_archive = archive_command()
+_hackban = hackban_command()
+_nick = nick_command()
+_timeout = timeout_command()
+
 
 @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
 @app_commands.allowed_installs(guilds=True, users=True)
@@ -96,10 +108,32 @@ class Moderation(commands.GroupCog, name="moderation"):
     ):
         await self._invoke_hybrid(context, "purge", amount=amount, user=user)
 
-    @moderation_group.command(name="warnings")
+    @moderation_group.group(name="warnings", invoke_without_command=True)
     async def moderation_group_warnings(self, context: Context):
         await self._invoke_hybrid(context, "warnings")
 
+    @moderation_group_warnings.command(name="add")
+    async def moderation_group_warnings_add(
+        self, context: Context, user: discord.User, *, reason: str = "Not specified"
+    ):
+        await self._invoke_hybrid(context, "warnings add", user=user, reason=reason)
+
+    @moderation_group_warnings.command(name="remove")
+    async def moderation_group_warnings_remove(
+        self, context: Context, user: discord.User, warn_id: int
+    ):
+        await self._invoke_hybrid(
+            context, "warnings remove", user=user, warn_id=warn_id
+        )
+
+    @moderation_group_warnings.command(name="list")
+    async def moderation_group_warnings_list(
+        self, context: Context, user: discord.User, after_id: int = 0
+    ):
+        await self._invoke_hybrid(
+            context, "warnings list", user=user, after_id=after_id
+        )
+
     @moderation_group.command(name="archive")
     async def moderation_group_archive(self, context: Context, limit: int = 10):
         await self._invoke_hybrid(context, "archive", limit=limit)
@@ -139,26 +173,61 @@ class Moderation(commands.GroupCog, name="moderation"):
         reason: str = "Not specified",
         delete_messages: str = "none",
     ):
-        return await ban_command()(
+        return await _ban(
             self, context, user=user, reason=reason, delete_messages=delete_messages
         )
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="kick", description="Kicks a user from the server.")
     async def kick(self, context, user: discord.User, *, reason: str = "Not specified"):
-        return await kick_command()(self, context, user=user, reason=reason)
+        return await _kick(self, context, user=user, reason=reason)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="purge", description="Delete a number of messages.")
     async def purge(self, context, amount: int, user: discord.Member = None):
-        return await purge_command()(self, context, amount=amount, user=user)
+        return await _purge(self, context, amount=amount, user=user)
 
     @commands.check(_require_group_prefix)
-    @commands.hybrid_command(
-        name="warnings", description="Manage warnings of a user on a server."
+    @commands.hybrid_group(
+        name="warnings",
+        description="Manage warnings of a user on a server.",
+        invoke_without_command=True,
     )
     async def warnings(self, context):
-        return await warnings_command()(self, context)
+        return await _warnings(self, context)
+
+    @commands.check(_require_group_prefix)
+    @warnings.command(name="add", description="Adds a warning to a user in the server.")
+    @app_commands.describe(
+        user="The user that should be warned.",
+        reason="The reason why the user should be warned.",
+    )
+    async def warnings_add(
+        self, context, user: discord.User, *, reason: str = "Not specified"
+    ):
+        return await _warnings_add(self, context, user, reason=reason)
+
+    @commands.check(_require_group_prefix)
+    @warnings.command(
+        name="remove", description="Removes a warning from a user in the server."
+    )
+    @app_commands.describe(
+        user="The user that should get their warning removed.",
+        warn_id="The ID of the warning that should be removed.",
+    )
+    async def warnings_remove(self, context, user: discord.User, warn_id: int):
+        return await _warnings_remove(self, context, user, warn_id)
+
+    @commands.check(_require_group_prefix)
+    @warnings.command(
+        name="list", description="Shows the warnings of a user in the server."
+    )
+    @app_commands.describe(
+        user="The user you want to get the warnings of.",
+        after_id="Only show warnings with an ID greater than this one.",
+    )
+    async def warnings_list(self, context, user: discord.User, after_id: int = 0):
+        return await _warnings_list(self, context, user, after_id=after_id)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -166,7 +235,7 @@ class Moderation(commands.GroupCog, name="moderation"):
         description="Archives in a text file the last messages with a chosen limit of messages.",
     )
     async def archive(self, context, limit: int = 10):
-        return await archive_command()(self, context, limit=limit)
+        return await _archive(self, context, limit=limit)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -174,14 +243,14 @@ class Moderation(commands.GroupCog, name="moderation"):
         description="Bans a user without the user having to be in the server.",
     )
     async def hackban(self, context, user_id: str, *, reason: str = "Not specified"):
-        return await hackban_command()(self, context, user_id=user_id, reason=reason)
+        return await _hackban(self, context, user_id=user_id, reason=reason)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="nick", description="Change the nickname of a user on a server."
     )
     async def nick(self, context, user: discord.User, *, nickname: str = None):
-        return await nick_command()(self, context, user=user, nickname=nickname)
+        return await _nick(self, context, user=user, nickname=nickname)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -201,7 +270,7 @@ class Moderation(commands.GroupCog, name="moderation"):
         *,
         reason: str = "Not specified",
     ):
-        return await timeout_command()(
+        return await _timeout(
             self, context, user=user, duration=duration, reason=reason
         )
 
@@ -1,7 +1,227 @@
+import asyncio
+from datetime import timedelta
+
+import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+# Text channels scanned at the same time by a purge job
+PURGE_CONCURRENCY = 4
+
+# Discord only bulk deletes messages younger than 14 days; keep a safety margin
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+BULK_DELETE_LIMIT = 100
+
+# Seconds between progress updates sent to the moderator
+PURGE_PROGRESS_INTERVAL = 5
+
+# Purge jobs keyed by (guild_id, user_id); unfinished jobs stay here to be resumed
+PURGE_JOBS = {}
+
+
+class MessagePurge:
+    """
+    Deletes every message a user sent in a guild's text channels.
+
+    Channels are scanned concurrently, newest message first. Messages younger
+    than BULK_DELETE_MAX_AGE are removed in bulk, older ones one at a time.
+    Each channel keeps a cursor (the oldest message already handled), so a job
+    that stopped early picks up where it left off when it is run again.
+    """
+
+    def __init__(self, guild: discord.Guild, user_id: int) -> None:
+        self.guild = guild
+        self.user_id = user_id
+        self.cursors = {}
+        self.finished = set()
+        self.failed = set()
+        self.total = 0
+        self.deleted = 0
+        self.task = None
+        self.reporter = None
+
+    @property
+    def scanned(self) -> int:
+        return len(self.finished) + len(self.failed)
+
+    @property
+    def error(self):
+        if self.task is None or not self.task.done() or self.task.cancelled():
+            return None
+        return self.task.exception()
+
+    def channels(self) -> list:
+        channels = []
+        for channel in self.guild.text_channels:
+            permissions = channel.permissions_for(self.guild.me)
+            if permissions.read_message_history and permissions.manage_messages:
+                channels.append(channel)
+        return channels
+
+    async def run(self) -> None:
+        channels = self.channels()
+        pending = [c for c in channels if c.id not in self.finished]
+        self.total = len(channels)
+        self.finished.intersection_update(c.id for c in channels)
+        self.failed.clear()
+        semaphore = asyncio.Semaphore(PURGE_CONCURRENCY)
+
+        async def worker(channel):
+            async with semaphore:
+                try:
+                    await self.purge_channel(channel)
+                except (
+                    discord.HTTPException,
+                    aiohttp.ClientError,
+                    OSError,
+                    TimeoutError,
+                ):
+                    self.failed.add(channel.id)
+                else:
+                    self.finished.add(channel.id)
+
+        # Anything unexpected cancels the other channels before the job reports back
+        async with asyncio.TaskGroup() as group:
+            for channel in pending:
+                group.create_task(worker(channel))
+        if not self.failed:
+            PURGE_JOBS.pop((self.guild.id, self.user_id), None)
+
+    async def purge_channel(self, channel: discord.TextChannel) -> None:
+        cursor = self.cursors.get(channel.id)
+        before = discord.Object(id=cursor) if cursor else None
+        cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+        batch = []
+
+        async for message in channel.history(limit=None, before=before):
+            if message.author.id == self.user_id:
+                if message.created_at > cutoff:
+                    batch.append(message)
+                    if len(batch) >= BULK_DELETE_LIMIT:
+                        await self.bulk_delete(channel, batch)
+                        batch = []
+                else:
+                    if batch:
+                        await self.bulk_delete(channel, batch)
+                        batch = []
+                    await self.delete(message)
+
+            if not batch:
+                self.cursors[channel.id] = message.id
+
+        if batch:
+            await self.bulk_delete(channel, batch)
+
+    async def bulk_delete(self, channel: discord.TextChannel, messages: list) -> None:
+        try:
+            await channel.delete_messages(messages)
+        except discord.Forbidden:
+            raise
+        except discord.HTTPException:
+            for message in messages:
+                await self.delete(message)
+            return
+        self.deleted += len(messages)
+
+    async def delete(self, message: discord.Message) -> None:
+        try:
+            await message.delete()
+            self.deleted += 1
+        except discord.NotFound:
+            pass
+
+
+def build_purge_embed(user, job: MessagePurge) -> discord.Embed:
+    color = 0x7289DA
+    if not job.task.done():
+        description = (
+            f"Deleting messages from **{user}**...\n"
+            f"{job.scanned}/{job.total} channels scanned, **{job.deleted}** messages deleted."
+        )
+    else:
+        description = f"Deleted **{job.deleted}** messages from **{user}** across {job.total} channels."
+        if job.failed or job.task.cancelled() or job.error is not None:
+            color = 0xE02B2B
+            description += "\nThe purge did not finish. Ban the user again with all messages to resume it."
+
+    return discord.Embed(
+        title="Purge",
+        description=description,
+        color=color,
+    ).set_author(
+        name="Moderation",
+        icon_url="https://yes.nighty.works/raw/CPKHQd.png",
+    )
+
+
+async def report_purge(context, user, job: MessagePurge) -> None:
+    try:
+        message = await context.send(embed=build_purge_embed(user, job))
+    except discord.HTTPException:
+        message = None
+
+    while not job.task.done():
+        await asyncio.wait({job.task}, timeout=PURGE_PROGRESS_INTERVAL)
+        if message is None or job.task.done():
+            continue
+        try:
+            await message.edit(embed=build_purge_embed(user, job))
+        except discord.HTTPException:
+            message = None
+
+    if job.error is not None:
+        context.bot.logger.error(
+            f"Purge of {user} in {job.guild} failed", exc_info=job.error
+        )
+    elif job.failed:
+        context.bot.logger.warning(
+            f"Purge of {user} in {job.guild} left {len(job.failed)} channels unfinished"
+        )
+
+    embed = build_purge_embed(user, job)
+    if message is not None:
+        try:
+            await message.edit(embed=embed)
+            return
+        except discord.HTTPException:
+            pass
+    try:
+        await context.author.send(embed=embed)
+    except discord.HTTPException:
+        pass
+
+
+def start_message_purge(guild: discord.Guild, user_id: int):
+    """
+    Starts (or resumes) a background job deleting all of a user's messages.
+
+    :param guild: The guild the user was banned from.
+    :param user_id: The ID of the banned user.
+    :return: The running job, or None if a purge for this user is already running.
+    """
+    key = (guild.id, user_id)
+    job = PURGE_JOBS.get(key)
+    if job is not None and job.task is not None and not job.task.done():
+        return None
+    if job is None:
+        job = PURGE_JOBS[key] = MessagePurge(guild, user_id)
+
+    job.task = asyncio.create_task(job.run())
+    return job
+
+
+def format_delete_time(delete_option: str) -> str:
+    time_formats = {
+        "1h": "Last 1 hour",
+        "6h": "Last 6 hours",
+        "12h": "Last 12 hours",
+        "1d": "Last 24 hours",
+        "3d": "Last 3 days",
+        "7d": "Last 7 days",
+    }
+    return time_formats.get(delete_option, "Unknown time period")
+
 
 def ban_command():
     @commands.hybrid_command(
@@ -152,8 +372,9 @@ def ban_command():
                         user, reason=reason, delete_message_days=delete_message_days
                     )
 
+                purge = None
                 if delete_all_messages:
-                    await self.delete_all_user_messages(context.guild, user.id)
+                    purge = start_message_purge(context.guild, user.id)
 
                 embed = discord.Embed(
                     title="Ban",
@@ -168,10 +389,14 @@ def ban_command():
                 if delete_messages != "none":
                     if delete_all_messages:
                         embed.add_field(
-                            name="Messages Deleted:", value="All messages", inline=False
+                            name="Messages Deleted:",
+                            value="All messages (purging in the background)"
+                            if purge is not None
+                            else "All messages (a purge is already running)",
+                            inline=False,
                         )
                     else:
-                        delete_time_text = self.format_delete_time(delete_messages)
+                        delete_time_text = format_delete_time(delete_messages)
                         embed.add_field(
                             name="Messages Deleted:",
                             value=delete_time_text,
@@ -180,6 +405,11 @@ def ban_command():
 
                 await context.send(embed=embed)
 
+                if purge is not None:
+                    purge.reporter = asyncio.create_task(
+                        report_purge(context, user, purge)
+                    )
+
             except discord.Forbidden:
                 embed = discord.Embed(
                     title="Error!",
@@ -231,47 +461,4 @@ def ban_command():
             )
             await context.send(embed=embed, ephemeral=True)
 
-    async def delete_all_user_messages(
-        self, guild: discord.Guild, user_id: int
-    ) -> None:
-        for channel in guild.text_channels:
-            try:
-                permissions = channel.permissions_for(guild.me)
-                if not (
-                    permissions.read_message_history and permissions.manage_messages
-                ):
-                    continue
-
-                deleted = True
-                while deleted:
-                    deleted = False
-                    try:
-                        async for message in channel.history(limit=100):
-                            if message.author.id == user_id:
-                                try:
-                                    await message.delete()
-                                    deleted = True
-                                except (
-                                    discord.NotFound,
-                                    discord.Forbidden,
-                                    discord.HTTPException,
-                                ):
-                                    continue
-                    except (discord.Forbidden, discord.HTTPException):
-                        break
-
-            except (discord.Forbidden, discord.HTTPException):
-                continue
-
-    def format_delete_time(self, delete_option: str) -> str:
-        time_formats = {
-            "1h": "Last 1 hour",
-            "6h": "Last 6 hours",
-            "12h": "Last 12 hours",
-            "1d": "Last 24 hours",
-            "3d": "Last 3 days",
-            "7d": "Last 7 days",
-        }
-        return time_formats.get(delete_option, "Unknown time period")
-
     return ban
@@ -1,7 +1,8 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from discord.ext.commands import Context
+
+WARNINGS_PAGE_SIZE = 10
 
 
 def warnings_command():
@@ -37,7 +38,7 @@ def warnings_command():
             ).set_author(
                 name="Moderation", icon_url="https://yes.nighty.works/raw/CPKHQd.png"
             )
-            return await self.send_embed(context, embed, ephemeral=True)
+            return await send_embed(context, embed, ephemeral=True)
 
         if context.invoked_subcommand is None:
             embed = discord.Embed(
@@ -48,7 +49,7 @@ def warnings_command():
             embed.set_author(
                 name="Moderation", icon_url="https://yes.nighty.works/raw/CPKHQd.png"
             )
-            await self.send_embed(context, embed)
+            await send_embed(context, embed)
 
     @warning.command(
         name="add",
@@ -59,7 +60,7 @@ def warnings_command():
         reason="The reason why the user should be warned.",
     )
     async def warning_add(
-        self, context: Context, user: discord.User, *, reason: str = "Not specified"
+        self, context, user: discord.User, *, reason: str = "Not specified"
     ) -> None:
         """
         Warns a user in his private messages.
@@ -76,7 +77,7 @@ def warnings_command():
             ).set_author(
                 name="Moderation", icon_url="https://yes.nighty.works/raw/CPKHQd.png"
             )
-            return await self.send_embed(context, embed, ephemeral=True)
+            return await send_embed(context, embed, ephemeral=True)
         member = context.guild.get_member(user.id) or await context.guild.fetch_member(
             user.id
         )
@@ -92,7 +93,7 @@ def warnings_command():
             name="Moderation", icon_url="https://yes.nighty.works/raw/CPKHQd.png"
         )
         embed.add_field(name="Reason:", value=reason)
-        await self.send_embed(context, embed)
+        await send_embed(context, embed)
         try:
             dm_embed = discord.Embed(
                 title="Warning",
@@ -109,7 +110,7 @@ def warnings_command():
                 description=f"{member.mention}, you were warned by **{context.author}**!\nReason: {reason}",
                 color=0xE02B2B,
             )
-            await self.send_embed(context, fallback)
+            await send_embed(context, fallback)
 
     @warning.command(
         name="remove",
@@ -119,9 +120,7 @@ def warnings_command():
         user="The user that should get their warning removed.",
         warn_id="The ID of the warning that should be removed.",
     )
-    async def warning_remove(
-        self, context: Context, user: discord.User, warn_id: int
-    ) -> None:
+    async def warning_remove(self, context, user: discord.User, warn_id: int) -> None:
         """
         Removes a warning from a user.
 
@@ -137,7 +136,7 @@ def warnings_command():
             ).set_author(
                 name="Moderation", icon_url="https://yes.nighty.works/raw/CPKHQd.png"
             )
-            return await self.send_embed(context, embed, ephemeral=True)
+            return await send_embed(context, embed, ephemeral=True)
         member = context.guild.get_member(user.id) or await context.guild.fetch_member(
             user.id
         )
@@ -150,19 +149,25 @@ def warnings_command():
         embed.set_author(
             name="Moderation", icon_url="https://yes.nighty.works/raw/CPKHQd.png"
         )
-        await self.send_embed(context, embed)
+        await send_embed(context, embed)
 
     @warning.command(
         name="list",
         description="Shows the warnings of a user in the server.",
     )
-    @app_commands.describe(user="The user you want to get the warnings of.")
-    async def warning_list(self, context: Context, user: discord.User) -> None:
+    @app_commands.describe(
+        user="The user you want to get the warnings of.",
+        after_id="Only show warnings with an ID greater than this one.",
+    )
+    async def warning_list(
+        self, context, user: discord.User, after_id: int = 0
+    ) -> None:
         """
-        Shows the warnings of a user in the server.
+        Shows the warnings of a user in the server, one page at a time.
 
         :param context: The hybrid command context.
         :param user: The user you want to get the warnings of.
+        :param after_id: Only show warnings with an ID greater than this one.
         """
         if not context.author.guild_permissions.manage_messages:
             embed = discord.Embed(
@@ -172,8 +177,13 @@ def warnings_command():
             ).set_author(
                 name="Moderation", icon_url="https://yes.nighty.works/raw/CPKHQd.png"
             )
-            return await self.send_embed(context, embed, ephemeral=True)
-        warnings_list = await self.bot.database.get_warnings(user.id, context.guild.id)
+            return await send_embed(context, embed, ephemeral=True)
+        total = await self.bot.database.get_warn_count(user.id, context.guild.id)
+        warnings_list = await self.bot.database.get_warnings_page(
+            user.id, context.guild.id, after_id, WARNINGS_PAGE_SIZE + 1
+        )
+        has_more = len(warnings_list) > WARNINGS_PAGE_SIZE
+        warnings_list = warnings_list[:WARNINGS_PAGE_SIZE]
         embed = discord.Embed(title=f"Warnings of {user}", color=0x7289DA)
         embed.set_author(
             name="Moderation", icon_url="https://yes.nighty.works/raw/CPKHQd.png"
@@ -183,8 +193,15 @@ def warnings_command():
             description = "This user has no warnings."
         else:
             for warning in warnings_list:
-                description += f"• Warned by <@{warning[2]}>: **{warning[3]}** (<t:{warning[4]}>) - Warn ID #{warning[5]}\n"
+                reason = warning[3]
+                if len(reason) > 200:
+                    reason = reason[:197] + "..."
+                description += f"• Warned by <@{warning[2]}>: **{reason}** (<t:{warning[4]}>) - Warn ID #{warning[5]}\n"
         embed.description = description
-        await self.send_embed(context, embed)
+        footer = f"Total warns: {total}"
+        if has_more:
+            footer += f" • Next page: after_id {warnings_list[-1][5]}"
+        embed.set_footer(text=footer)
+        await send_embed(context, embed)
 
     return warning
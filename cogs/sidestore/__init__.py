@@ -15,6 +15,17 @@ from .half import half_command
 from .sparse import sparse_command
 from .unofficial import unofficial_command
 
+_refresh = refresh_command()
+_code = code_command()
+_crash = crash_command()
+_pairing = pairing_command()
+_server = server_command()
+_afc = afc_command()
+_udid = udid_command()
+_half = half_command()
+_sparse = sparse_command()
+_unofficial = unofficial_command()
+
 
 @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
 @app_commands.allowed_installs(guilds=True, users=True)
@@ -129,68 +140,68 @@ class Sidestore(commands.GroupCog, name="sidestore"):
         name="refresh", description="Help with refreshing or installing apps"
     )
     async def refresh(self, context):
-        return await refresh_command()(self, context)
+        return await _refresh(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="code", description="No code received when signing in with Apple ID"
     )
     async def code(self, context):
-        return await code_command()(self, context)
+        return await _code(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="crash", description="Help with SideStore crashing issues"
     )
     async def crash(self, context):
-        return await crash_command()(self, context)
+        return await _crash(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="pairing", description="Help with pairing file issues"
     )
     async def pairing(self, context):
-        return await pairing_command()(self, context)
+        return await _pairing(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="server", description="Help with anisette server issues"
     )
     async def server(self, context):
-        return await server_command()(self, context)
+        return await _server(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="afc", description="Help with AFC Connection Failure issues"
     )
     async def afc(self, context):
-        return await afc_command()(self, context)
+        return await _afc(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="udid", description="SideStore could not determine device UDID"
     )
     async def udid(self, context):
-        return await udid_command()(self, context)
+        return await _udid(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(name="half", description="Help with half-installed apps")
     async def half(self, context):
-        return await half_command()(self, context)
+        return await _half(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="sparse", description="Help with sparse bundle issues"
     )
     async def sparse(self, context):
-        return await sparse_command()(self, context)
+        return await _sparse(self, context)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
         name="unofficial", description="Unofficial guides and video walkthroughs"
     )
     async def unofficial(self, context):
-        return await unofficial_command()(self, context)
+        return await _unofficial(self, context)
 
 
 async def setup(bot) -> None:
@@ -7,6 +7,10 @@ from .translate import translate_command, language_autocomplete
 from .codepreview import codepreview_command
 from .dictionary import dictionary_command
 
+_translate = translate_command()
+_codepreview = codepreview_command()
+_dictionary = dictionary_command()
+
 
 @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
 @app_commands.allowed_installs(guilds=True, users=True)
@@ -89,7 +93,7 @@ class Utilities(commands.GroupCog, name="utils"):
     async def translate(
         self, context, text: str = None, to_lang: str = "en", from_lang: str = None
     ):
-        return await translate_command()(
+        return await _translate(
             self, context, text=text, to_lang=to_lang, from_lang=from_lang
         )
 
@@ -98,7 +102,7 @@ class Utilities(commands.GroupCog, name="utils"):
         name="codepreview", description="Preview code from GitHub URLs"
     )
     async def codepreview(self, context, url: str = None):
-        return await codepreview_command()(self, context, url=url)
+        return await _codepreview(self, context, url=url)
 
     @commands.check(_require_group_prefix)
     @commands.hybrid_command(
@@ -106,7 +110,7 @@ class Utilities(commands.GroupCog, name="utils"):
     )
     @app_commands.describe(word="The word to look up")
     async def dictionary(self, context, word: str = None):
-        return await dictionary_command()(self, context, word=word)
+        return await _dictionary(self, context, word=word)
 
 
 async def setup(bot) -> None:
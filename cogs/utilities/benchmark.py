@@ -0,0 +1,70 @@
+"""
+Measures translate language autocomplete latency with the prebuilt index
+against a linear substring scan over the languages dict.
+
+Usage: python -m cogs.utilities.benchmark [--iterations 20000]
+"""
+
+import argparse
+import random
+import statistics
+import string
+import time
+
+from .translate import languages, search_languages
+
+SAMPLE_QUERIES = ["", "e", "en", "sp", "span", "chi", "simpl", "zh-", "ese", "xyz"]
+
+
+def linear_scan(current: str, limit: int = 25) -> list:
+    current = current.lower()
+    matches = []
+    for code, name in languages.items():
+        if current in code.lower() or current in name.lower():
+            matches.append(code)
+        if len(matches) >= limit:
+            break
+    return matches
+
+
+def build_queries(count: int) -> list:
+    rng = random.Random(0)
+    queries = []
+    names = list(languages.values())
+    for _ in range(count):
+        choice = rng.random()
+        if choice < 0.6:
+            name = rng.choice(names)
+            queries.append(name[: rng.randint(0, len(name))])
+        elif choice < 0.8:
+            queries.append(rng.choice(SAMPLE_QUERIES))
+        else:
+            queries.append(
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6)))
+            )
+    return queries
+
+
+def measure(search, queries: list) -> tuple:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    queries = build_queries(args.iterations)
+    for label, search in (("linear scan", linear_scan), ("index", search_languages)):
+        p50, p99 = measure(search, queries)
+        print(f"{label:<12} p50 {p50:8.2f} us   p99 {p99:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
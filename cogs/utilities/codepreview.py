@@ -1,9 +1,111 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import aiohttp
+import asyncio
 import re
 
+from utils.cache import TTLCache
+from utils.github import RateLimitError
+
+# Seconds a cached GitHub response is served before it is revalidated by ETag
+GITHUB_CACHE_TTL = 300
+
+GITHUB_CACHE = TTLCache(maxsize=256, ttl=GITHUB_CACHE_TTL)
+
+# Preview budget for PR diffs, reading stops once either limit is reached
+DIFF_MAX_LENGTH = 1900
+DIFF_MAX_LINES = 100
+
+# Preview budget for files, lines past it are only counted
+FILE_MAX_LENGTH = 1900
+FILE_MAX_LINES = 100
+
+
+async def iter_response_lines(response, max_line_length=DIFF_MAX_LENGTH):
+    buffer = b""
+    skipping = False
+    async for chunk in response.content.iter_chunked(8192):
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+                continue
+            yield line[:max_line_length].decode("utf-8", "replace").rstrip("\r")
+        if skipping:
+            buffer = b""
+        elif len(buffer) > max_line_length:
+            yield buffer[:max_line_length].decode("utf-8", "ignore")
+            buffer = b""
+            skipping = True
+    if buffer and not skipping:
+        yield buffer.decode("utf-8", "replace").rstrip("\r")
+
+
+async def read_diff_preview(response):
+    lines = []
+    length = 0
+    async for line in iter_response_lines(response):
+        if len(lines) >= DIFF_MAX_LINES or length + len(line) + 11 > DIFF_MAX_LENGTH:
+            return lines, True
+        lines.append(line)
+        length += len(line) + 1
+    return lines, False
+
+
+async def read_file_preview(response, start_line=None, end_line=None):
+    first_line = start_line or 1
+    last_line = end_line or start_line
+    lines = []
+    length = 0
+    remaining = 0
+    line_number = 0
+    async for line in iter_response_lines(response, FILE_MAX_LENGTH):
+        line_number += 1
+        if line_number < first_line:
+            continue
+        if last_line and line_number > last_line:
+            break
+        if (
+            remaining
+            or len(lines) >= FILE_MAX_LINES
+            or length + len(line) + 1 > FILE_MAX_LENGTH
+        ):
+            remaining += 1
+            continue
+        lines.append(line)
+        length += len(line) + 1
+    return lines, remaining
+
+
+async def read_text(response):
+    return await response.text()
+
+
+async def read_json(response):
+    return await response.json()
+
+
+async def fetch_cached(http, key, url, headers=None, *, read=read_text):
+    cached = GITHUB_CACHE.get(key)
+    if cached is not None:
+        return cached[1]
+
+    headers = dict(headers or {})
+    stale = GITHUB_CACHE.get_stale(key)
+    if stale is not None and stale[0]:
+        headers["If-None-Match"] = stale[0]
+
+    async with http.get(url, headers=headers) as response:
+        if response.status == 304 and stale is not None:
+            GITHUB_CACHE.touch(key)
+            return stale[1]
+        if response.status != 200:
+            return None
+        body = await read(response)
+        GITHUB_CACHE.set(key, (response.headers.get("ETag"), body))
+        return body
+
 
 def codepreview_command():
     LANGUAGE_MAP = {
@@ -54,57 +156,63 @@ def codepreview_command():
                 return lang
         return ""
 
-    async def fetch_github_content(url):
+    async def fetch_github_content(http, parsed):
+        start_line, end_line = parsed["start_line"], parsed["end_line"]
+        key = (
+            parsed["owner"],
+            parsed["repo"],
+            parsed["branch"],
+            parsed["filepath"],
+            start_line,
+            end_line,
+        )
+
+        async def read(response):
+            return await read_file_preview(response, start_line, end_line)
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        return await response.text()
+            return await fetch_cached(http, key, parsed["raw_url"], read=read)
         except Exception:
             pass
         return None
 
-    async def fetch_pr_diff(owner, repo, pr_number):
+    async def fetch_pr_diff(github, owner, repo, pr_number):
         try:
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
-            headers = {
-                "Accept": "application/vnd.github.v3.diff",
-                "User-Agent": "Discord-Bot",
-            }
+            api_url = f"/repos/{owner}/{repo}/pulls/{pr_number}"
+            headers = {"Accept": "application/vnd.github.v3.diff"}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(api_url, headers=headers) as response:
-                    if response.status == 200:
-                        diff_content = await response.text()
-                        return diff_content
+            key = (owner, repo, int(pr_number), "diff")
+            return await fetch_cached(
+                github, key, api_url, headers, read=read_diff_preview
+            )
+        except RateLimitError:
+            raise
         except Exception:
             pass
         return None
 
-    async def fetch_pr_info(owner, repo, pr_number):
+    async def fetch_pr_info(github, owner, repo, pr_number):
         try:
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "Discord-Bot",
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(api_url, headers=headers) as response:
-                    if response.status == 200:
-                        pr_data = await response.json()
-                        return {
-                            "title": pr_data.get("title", ""),
-                            "number": pr_data.get("number", pr_number),
-                            "state": pr_data.get("state", ""),
-                            "merged": pr_data.get("merged", False),
-                            "additions": pr_data.get("additions", 0),
-                            "deletions": pr_data.get("deletions", 0),
-                            "changed_files": pr_data.get("changed_files", 0),
-                            "user": pr_data.get("user", {}).get("login", ""),
-                            "base_branch": pr_data.get("base", {}).get("ref", ""),
-                            "head_branch": pr_data.get("head", {}).get("ref", ""),
-                        }
+            api_url = f"/repos/{owner}/{repo}/pulls/{pr_number}"
+            headers = {"Accept": "application/vnd.github.v3+json"}
+
+            key = (owner, repo, int(pr_number), "info")
+            pr_data = await fetch_cached(github, key, api_url, headers, read=read_json)
+            if pr_data:
+                return {
+                    "title": pr_data.get("title", ""),
+                    "number": pr_data.get("number", pr_number),
+                    "state": pr_data.get("state", ""),
+                    "merged": pr_data.get("merged", False),
+                    "additions": pr_data.get("additions", 0),
+                    "deletions": pr_data.get("deletions", 0),
+                    "changed_files": pr_data.get("changed_files", 0),
+                    "user": pr_data.get("user", {}).get("login", ""),
+                    "base_branch": pr_data.get("base", {}).get("ref", ""),
+                    "head_branch": pr_data.get("head", {}).get("ref", ""),
+                }
+        except RateLimitError:
+            raise
         except Exception:
             pass
         return None
@@ -158,15 +266,6 @@ def codepreview_command():
             }
         return None
 
-    def extract_lines(content, start_line, end_line):
-        lines = content.split("\n")
-
-        if start_line and end_line:
-            return "\n".join(lines[start_line - 1 : end_line])
-        elif start_line:
-            return lines[start_line - 1] if start_line <= len(lines) else content
-        return content
-
     @commands.hybrid_command(
         name="codepreview",
         description="Preview code from GitHub URLs",
@@ -314,12 +413,31 @@ def codepreview_command():
             return
 
         if parsed.get("type") == "pr":
-            pr_info = await fetch_pr_info(
-                parsed["owner"], parsed["repo"], parsed["pr_number"]
-            )
-            diff_content = await fetch_pr_diff(
-                parsed["owner"], parsed["repo"], parsed["pr_number"]
-            )
+            try:
+                pr_info, diff_content = await asyncio.gather(
+                    fetch_pr_info(
+                        self.bot.github,
+                        parsed["owner"],
+                        parsed["repo"],
+                        parsed["pr_number"],
+                    ),
+                    fetch_pr_diff(
+                        self.bot.github,
+                        parsed["owner"],
+                        parsed["repo"],
+                        parsed["pr_number"],
+                    ),
+                )
+            except RateLimitError as e:
+                embed = discord.Embed(
+                    title="Error",
+                    description=f"GitHub API rate limit reached. Try again <t:{int(e.reset)}:R>.",
+                    color=0xE02B2B,
+                ).set_author(
+                    name="Utility", icon_url="https://yes.nighty.works/raw/8VLDcg.webp"
+                )
+                await send_embed(context, embed, ephemeral=True)
+                return
 
             if not pr_info or not diff_content:
                 embed = discord.Embed(
@@ -376,42 +494,12 @@ def codepreview_command():
 
             await context.channel.send(embed=embed)
 
-            max_diff_length = 1900
-            max_lines = 100
-
-            diff_lines = diff_content.split("\n")
-
-            if len(diff_lines) > max_lines:
-                diff_lines = diff_lines[:max_lines]
-                diff_lines.append(
-                    f"\n... ({len(diff_content.split(chr(10))) - max_lines} more lines omitted)"
-                )
-
-            current_chunk = ""
-
-            for line in diff_lines:
-                test_chunk = current_chunk + line + "\n"
-
-                if len(test_chunk) + 10 > max_diff_length:
-                    if current_chunk.strip():
-                        remaining_lines = len(diff_lines) - len(
-                            current_chunk.split("\n")
-                        )
-                        if remaining_lines > 0:
-                            current_chunk += (
-                                f"\n... ({remaining_lines} more lines omitted)"
-                            )
-                        await context.channel.send(
-                            f"```diff\n{current_chunk.rstrip()}\n```"
-                        )
-                    break
-                else:
-                    current_chunk = test_chunk
-            else:
-                if current_chunk.strip():
-                    await context.channel.send(
-                        f"```diff\n{current_chunk.rstrip()}\n```"
-                    )
+            diff_lines, truncated = diff_content
+            diff_text = "\n".join(diff_lines).rstrip()
+            if truncated:
+                diff_text += "\n... (more lines omitted)"
+            if diff_text.strip():
+                await context.channel.send(f"```diff\n{diff_text}\n```")
 
             if interaction is not None:
                 try:
@@ -420,9 +508,9 @@ def codepreview_command():
                     pass
             return
 
-        content = await fetch_github_content(parsed["raw_url"])
+        content = await fetch_github_content(self.bot.http_client, parsed)
 
-        if not content:
+        if not content or not content[0]:
             embed = discord.Embed(
                 title="Error",
                 description="Failed to fetch content from GitHub. The file might not exist or be accessible.",
@@ -433,21 +521,19 @@ def codepreview_command():
             await send_embed(context, embed, ephemeral=True)
             return
 
+        code_lines, remaining_lines = content
+        code = "\n".join(code_lines)
+        if remaining_lines:
+            code += f"\n\n... ({remaining_lines} more lines omitted)"
+
         if parsed["start_line"]:
-            code = extract_lines(content, parsed["start_line"], parsed["end_line"])
             line_info = f" (Lines {parsed['start_line']}"
             if parsed["end_line"]:
                 line_info += f"-{parsed['end_line']}"
             line_info += ")"
         else:
-            code = content
             line_info = ""
 
-        code_lines = code.split("\n")
-        if len(code_lines) > 100:
-            code = "\n".join(code_lines[:100])
-            code += f"\n\n... ({len(code_lines) - 100} more lines omitted)"
-
         filename = parsed["filepath"].split("/")[-1]
         language = get_language_from_filename(filename)
 
@@ -470,57 +556,18 @@ def codepreview_command():
 
         code_block = f"```{language}\n{code}\n```"
 
-        if len(code_block) > 1990:
-            interaction = getattr(context, "interaction", None)
-            if interaction is not None:
-                if not interaction.response.is_done():
-                    await interaction.response.defer(ephemeral=True)
-                await context.channel.send(embed=embed)
-            else:
-                await context.channel.send(embed=embed)
-
-            max_code_length = 1980 - len(language) - 8
-            code_lines = code.split("\n")
-            current_chunk = []
-            current_length = 0
-
-            for line in code_lines:
-                line_length = len(line) + 1
-                if current_length + line_length > max_code_length:
-                    remaining_lines = len(code_lines) - len(current_chunk)
-                    if remaining_lines > 0:
-                        current_chunk.append(
-                            f"\n... ({remaining_lines} more lines omitted)"
-                        )
-                    chunk_text = "\n".join(current_chunk)
-                    await context.channel.send(f"```{language}\n{chunk_text}\n```")
-                    break
-                else:
-                    current_chunk.append(line)
-                    current_length += line_length
-            else:
-                if current_chunk:
-                    chunk_text = "\n".join(current_chunk)
-                    await context.channel.send(f"```{language}\n{chunk_text}\n```")
-
-            if interaction is not None:
-                try:
-                    await interaction.delete_original_response()
-                except:
-                    pass
+        interaction = getattr(context, "interaction", None)
+        if interaction is not None:
+            if not interaction.response.is_done():
+                await interaction.response.defer(ephemeral=True)
+            await context.channel.send(embed=embed)
+            await context.channel.send(code_block)
+            try:
+                await interaction.delete_original_response()
+            except:
+                pass
         else:
-            interaction = getattr(context, "interaction", None)
-            if interaction is not None:
-                if not interaction.response.is_done():
-                    await interaction.response.defer(ephemeral=True)
-                await context.channel.send(embed=embed)
-                await context.channel.send(code_block)
-                try:
-                    await interaction.delete_original_response()
-                except:
-                    pass
-            else:
-                await context.channel.send(embed=embed)
-                await context.channel.send(code_block)
+            await context.channel.send(embed=embed)
+            await context.channel.send(code_block)
 
     return codepreview
@@ -2,6 +2,50 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import aiohttp
+import aiosqlite
+import json
+import time
+
+from utils.cache import TTLCache
+
+# Seconds a definition, or a word the API doesn't know, stays cached
+DEFINITION_TTL = 86400
+NOT_FOUND_TTL = 3600
+
+DEFINITION_CACHE = TTLCache(maxsize=1024, ttl=DEFINITION_TTL)
+
+NOT_FOUND = {"success": False, "error": "Word not found"}
+
+
+async def load_cached_definition(database, word: str):
+    cached = DEFINITION_CACHE.get(word)
+    if cached is not None or database is None:
+        return cached
+
+    try:
+        row = await database.get_dictionary_entry(word)
+    except aiosqlite.Error as e:
+        database.logger.warning(f"Could not read cached definition of {word!r}: {e}")
+        return None
+    if row is None:
+        return None
+
+    data, expires_at = row
+    result = NOT_FOUND if data is None else {"success": True, "data": json.loads(data)}
+    DEFINITION_CACHE.set(word, result, ttl=expires_at - time.time())
+    return result
+
+
+async def store_cached_definition(database, word: str, result: dict, ttl: int):
+    DEFINITION_CACHE.set(word, result, ttl=ttl)
+    if database is None:
+        return
+
+    data = json.dumps(result["data"]) if result["success"] else None
+    try:
+        await database.set_dictionary_entry(word, data, int(time.time() + ttl))
+    except aiosqlite.Error as e:
+        database.logger.warning(f"Could not cache definition of {word!r}: {e}")
 
 
 def dictionary_command():
@@ -19,22 +63,33 @@ def dictionary_command():
         else:
             await context.send(embed=embed)
 
-    async def fetch_definition(word: str) -> dict:
+    async def fetch_definition(http, word: str, database=None) -> dict:
+        word = word.lower()
+        cached = await load_cached_definition(database, word)
+        if cached is not None:
+            return cached
+
         try:
-            url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word.lower()}"
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {"success": True, "data": data}
-                    elif response.status == 404:
-                        return {"success": False, "error": "Word not found"}
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"API returned status code {response.status}",
-                        }
+            url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+
+            async with http.get(url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    result = {"success": True, "data": data[:1]}
+                    await store_cached_definition(
+                        database, word, result, DEFINITION_TTL
+                    )
+                    return result
+                elif response.status == 404:
+                    await store_cached_definition(
+                        database, word, NOT_FOUND, NOT_FOUND_TTL
+                    )
+                    return NOT_FOUND
+                else:
+                    return {
+                        "success": False,
+                        "error": f"API returned status code {response.status}",
+                    }
         except aiohttp.ClientError:
             return {"success": False, "error": "Network error occurred"}
         except Exception:
@@ -83,7 +138,7 @@ def dictionary_command():
         if interaction is not None and not interaction.response.is_done():
             await interaction.response.defer()
 
-        result = await fetch_definition(word)
+        result = await fetch_definition(self.bot.http_client, word, self.bot.database)
 
         if not result["success"]:
             error_message = result.get("error", "Unknown error")
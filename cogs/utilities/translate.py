@@ -1,10 +1,13 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import aiohttp
+import asyncio
+import hashlib
 import re
 import json
 
+from utils.cache import TTLCache
+
 
 languages = {
     "auto": "Auto-detect",
@@ -131,29 +134,99 @@ languages = {
 }
 
 
-async def language_autocomplete(
-    interaction: discord.Interaction, current: str
-) -> list[app_commands.Choice[str]]:
-    current = current.lower()
+# Chunks of a single message translated at the same time
+TRANSLATE_CONCURRENCY = 4
+
+TRANSLATION_CACHE = TTLCache(maxsize=512, ttl=3600)
+IN_FLIGHT_TRANSLATIONS = {}
+
+
+POPULAR_LANGUAGES = ["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh-CN"]
+
+
+# Prefix matches rank exact code, code prefix, name prefix, then word prefix;
+# trigrams narrow down the candidates for substring matches
+def build_language_index(languages: dict):
     choices = []
+    folded_names = []
+    prefix_ranks = {}
+    trigrams = {}
+
+    for idx, (code, name) in enumerate(languages.items()):
+        display_name = f"{code} - {name}"
+        if len(display_name) > 100:
+            display_name = f"{code} - {name[:90]}..."
+        choices.append(app_commands.Choice(name=display_name, value=code))
+
+        folded_code = code.casefold()
+        folded_name = name.casefold()
+        folded_names.append(f"{folded_code} {folded_name}")
+
+        keys = [(folded_code[:end], 1) for end in range(1, len(folded_code) + 1)]
+        keys.append((folded_code, 0))
+        keys.extend((folded_name[:end], 2) for end in range(1, len(folded_name) + 1))
+        for word in re.findall(r"\w+", folded_name):
+            keys.extend((word[:end], 3) for end in range(1, len(word) + 1))
+
+        for key, rank in keys:
+            ranks = prefix_ranks.setdefault(key, {})
+            ranks[idx] = min(rank, ranks.get(idx, rank))
+
+        for text in (folded_code, folded_name):
+            for start in range(len(text) - 2):
+                trigrams.setdefault(text[start : start + 3], set()).add(idx)
+
+    prefixes = {
+        key: tuple(sorted(ranks, key=lambda idx: (ranks[idx], idx)))
+        for key, ranks in prefix_ranks.items()
+    }
+    return tuple(choices), tuple(folded_names), prefixes, trigrams
+
+
+(
+    LANGUAGE_CHOICES,
+    LANGUAGE_SEARCH_TEXT,
+    LANGUAGE_PREFIXES,
+    LANGUAGE_TRIGRAMS,
+) = build_language_index(languages)
+
+LANGUAGE_CODES = [choice.value for choice in LANGUAGE_CHOICES]
+
+POPULAR_CHOICES = [
+    LANGUAGE_CHOICES[LANGUAGE_CODES.index(code)] for code in POPULAR_LANGUAGES
+]
 
-    for code, name in languages.items():
-        if current in code.lower() or current in name.lower():
-            display_name = f"{code} - {name}"
-            if len(display_name) > 100:
-                display_name = f"{code} - {name[:90]}..."
-            choices.append(app_commands.Choice(name=display_name, value=code))
 
-        if len(choices) >= 25:
-            break
+def search_languages(current: str, limit: int = 25) -> list[app_commands.Choice[str]]:
+    current = current.casefold().strip()
+    if not current:
+        return list(LANGUAGE_CHOICES[:limit])
 
-    if not choices:
-        popular = ["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh-CN"]
-        for code in popular:
-            name = languages.get(code, code)
-            choices.append(app_commands.Choice(name=f"{code} - {name}", value=code))
+    matches = list(LANGUAGE_PREFIXES.get(current, ())[:limit])
 
-    return choices
+    if len(matches) < limit and len(current) >= 3:
+        candidates = None
+        for start in range(len(current) - 2):
+            ids = LANGUAGE_TRIGRAMS.get(current[start : start + 3])
+            if not ids:
+                candidates = None
+                break
+            candidates = ids if candidates is None else candidates & ids
+        if candidates:
+            seen = set(matches)
+            for idx in sorted(candidates):
+                if idx not in seen and current in LANGUAGE_SEARCH_TEXT[idx]:
+                    matches.append(idx)
+                    if len(matches) >= limit:
+                        break
+
+    return [LANGUAGE_CHOICES[idx] for idx in matches]
+
+
+async def language_autocomplete(
+    interaction: discord.Interaction, current: str
+) -> list[app_commands.Choice[str]]:
+    return search_languages(current) or list(POPULAR_CHOICES)
 
 
 def translate_command():
@@ -172,7 +245,7 @@ def translate_command():
             await context.send(embed=embed)
 
     async def _translate_with_google_web(
-        text: str, from_lang: str = "auto", to_lang: str = "en"
+        http, text: str, from_lang: str = "auto", to_lang: str = "en"
     ) -> dict:
         try:
             base_url = "https://translate.googleapis.com/translate_a/single"
@@ -203,40 +276,45 @@ def translate_command():
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
 
-            chunks = chunk_text(text)
-            translated_parts: list[str] = []
-            detected_lang_overall = from_lang
-
-            async with aiohttp.ClientSession() as session:
-                for idx, chunk in enumerate(chunks):
-                    params = {
-                        "client": "gtx",
-                        "sl": from_lang,
-                        "tl": to_lang,
-                        "dt": ["t", "bd"],
-                        "q": chunk,
-                    }
-                    async with session.get(
+            semaphore = asyncio.Semaphore(TRANSLATE_CONCURRENCY)
+
+            async def translate_chunk(chunk: str):
+                params = {
+                    "client": "gtx",
+                    "sl": from_lang,
+                    "tl": to_lang,
+                    "dt": ["t", "bd"],
+                    "q": chunk,
+                }
+                async with semaphore:
+                    async with http.get(
                         base_url, headers=headers, params=params
                     ) as response:
                         if response.status != 200:
                             return None
                         result_text = (await response.text()).strip()
-                        try:
-                            if result_text.startswith("[["):
-                                data = json.loads(result_text)
-                                part_text = ""
-                                if data and len(data) > 0 and data[0]:
-                                    for item in data[0]:
-                                        if item and len(item) > 0:
-                                            part_text += item[0] if item[0] else ""
-                                translated_parts.append(part_text)
-                                if idx == 0 and len(data) > 2 and data[2]:
-                                    detected_lang_overall = data[2]
-                            else:
-                                return None
-                        except Exception:
-                            return None
+                try:
+                    if result_text.startswith("[["):
+                        data = json.loads(result_text)
+                        part_text = ""
+                        if data and len(data) > 0 and data[0]:
+                            for item in data[0]:
+                                if item and len(item) > 0:
+                                    part_text += item[0] if item[0] else ""
+                        detected = data[2] if len(data) > 2 and data[2] else None
+                        return part_text, detected
+                except Exception:
+                    pass
+                return None
+
+            results = await asyncio.gather(
+                *(translate_chunk(chunk) for chunk in chunk_text(text))
+            )
+            if any(result is None for result in results):
+                return None
+
+            translated_parts = [part_text for part_text, _ in results]
+            detected_lang_overall = results[0][1] or from_lang
 
             return {
                 "translatedText": "".join(translated_parts).strip(),
@@ -245,6 +323,31 @@ def translate_command():
         except Exception:
             return None
 
+    async def translate_text(
+        http, guild_id, text: str, from_lang: str = "auto", to_lang: str = "en"
+    ) -> dict:
+        text_hash = hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+        key = (text_hash, from_lang, to_lang)
+        cached = TRANSLATION_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        flight_key = (guild_id, *key)
+        task = IN_FLIGHT_TRANSLATIONS.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                _translate_with_google_web(http, text, from_lang, to_lang)
+            )
+            IN_FLIGHT_TRANSLATIONS[flight_key] = task
+            task.add_done_callback(
+                lambda _: IN_FLIGHT_TRANSLATIONS.pop(flight_key, None)
+            )
+
+        result = await asyncio.shield(task)
+        if result and result.get("translatedText"):
+            TRANSLATION_CACHE.set(key, result)
+        return result
+
     @commands.hybrid_command(
         name="translate",
         description="Translate text to another language",
@@ -312,7 +415,13 @@ def translate_command():
             await send_embed(context, embed, ephemeral=True)
             return
 
-        result = await _translate_with_google_web(text, from_lang or "auto", to_lang)
+        result = await translate_text(
+            self.bot.http_client,
+            context.guild.id if context.guild else None,
+            text,
+            from_lang or "auto",
+            to_lang,
+        )
 
         if result and result.get("translatedText"):
             detected_lang = result.get("detectedSourceLanguage", from_lang or "auto")
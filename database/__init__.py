@@ -1,9 +1,133 @@
+import asyncio
+import logging
+
 import aiosqlite
 
+from .migrate import apply_migrations
+
+__all__ = ["DatabaseManager", "apply_migrations"]
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+CHANNEL_CONFIG_TABLES = {
+    "bait": (
+        "bait_configs",
+        "bait_channels",
+        ("protected_role_id", "log_channel_id"),
+    ),
+    "sticky": (
+        "sticky_configs",
+        "sticky_channels",
+        ("allowed_role_id", "message", "footer", "delay"),
+    ),
+}
+
 
 class DatabaseManager:
-    def __init__(self, *, connection: aiosqlite.Connection) -> None:
+    def __init__(
+        self,
+        *,
+        connection: aiosqlite.Connection,
+        max_batch: int = 64,
+        logger: logging.Logger | None = None,
+    ) -> None:
         self.connection = connection
+        self.max_batch = max_batch
+        self.logger = logger or logging.getLogger("discord_bot")
+        self._writes = asyncio.Queue()
+        self._writer = None
+
+    async def start(self) -> None:
+        """
+        This function will tune the connection and start the writer task.
+        """
+        for pragma in PRAGMAS:
+            await self.connection.execute(pragma)
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def close(self) -> None:
+        """
+        This function will flush pending writes and close the connection.
+        """
+        if self._writer is not None and not self._writer.done():
+            self._writes.put_nowait(None)
+            await self._writer
+        self._writer = None
+        await self.connection.close()
+
+    async def _write(self, operation):
+        if self._writer is None or self._writer.done():
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._writes.put_nowait((operation, future))
+        return await future
+
+    async def _write_loop(self) -> None:
+        while True:
+            item = await self._writes.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._writes.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            await self._commit_batch(batch)
+            if stop:
+                return
+
+    async def _commit_batch(self, batch: list) -> None:
+        outcomes = []
+        try:
+            await self.connection.execute("BEGIN IMMEDIATE")
+            for operation, future in batch:
+                await self.connection.execute("SAVEPOINT write_op")
+                try:
+                    result = await operation(self.connection)
+                except Exception as e:
+                    await self.connection.execute("ROLLBACK TO write_op")
+                    await self.connection.execute("RELEASE write_op")
+                    outcomes.append((future, None, e))
+                else:
+                    await self.connection.execute("RELEASE write_op")
+                    outcomes.append((future, result, None))
+            await self.connection.commit()
+        except Exception as e:
+            self.logger.exception(f"Failed to commit {len(batch)} database writes: {e}")
+            try:
+                await self.connection.rollback()
+            except (aiosqlite.Error, ValueError) as rollback_error:
+                self.logger.error(
+                    f"Failed to roll back database writes: {rollback_error}"
+                )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
 
     async def add_warn(
         self, user_id: int, server_id: int, moderator_id: int, reason: str
@@ -14,28 +138,34 @@ class DatabaseManager:
         :param user_id: The ID of the user that should be warned.
         :param reason: The reason why the user should be warned.
         """
-        rows = await self.connection.execute(
-            "SELECT id FROM warns WHERE user_id=? AND server_id=? ORDER BY id DESC LIMIT 1",
-            (
-                user_id,
-                server_id,
-            ),
-        )
-        async with rows as cursor:
-            result = await cursor.fetchone()
-            warn_id = result[0] + 1 if result is not None else 1
-            await self.connection.execute(
-                "INSERT INTO warns(id, user_id, server_id, moderator_id, reason) VALUES (?, ?, ?, ?, ?)",
+
+        async def operation(connection: aiosqlite.Connection) -> int:
+            rows = await connection.execute(
+                "INSERT INTO warns(id, user_id, server_id, moderator_id, reason) "
+                "SELECT COALESCE(MAX(id), 0) + 1, ?, ?, ?, ? FROM warns "
+                "WHERE user_id=? AND server_id=? RETURNING id",
                 (
-                    warn_id,
                     user_id,
                     server_id,
                     moderator_id,
                     reason,
+                    user_id,
+                    server_id,
                 ),
             )
-            await self.connection.commit()
-            return warn_id
+            async with rows as cursor:
+                result = await cursor.fetchone()
+            await connection.execute(
+                "INSERT INTO warn_counts(server_id, user_id, count) VALUES (?, ?, 1) "
+                "ON CONFLICT(server_id, user_id) DO UPDATE SET count=count + 1",
+                (
+                    server_id,
+                    user_id,
+                ),
+            )
+            return result[0]
+
+        return await self._write(operation)
 
     async def remove_warn(self, warn_id: int, user_id: int, server_id: int) -> int:
         """
@@ -45,25 +175,99 @@ class DatabaseManager:
         :param user_id: The ID of the user that was warned.
         :param server_id: The ID of the server where the user has been warned
         """
-        await self.connection.execute(
-            "DELETE FROM warns WHERE id=? AND user_id=? AND server_id=?",
+
+        async def operation(connection: aiosqlite.Connection) -> int:
+            cursor = await connection.execute(
+                "DELETE FROM warns WHERE id=? AND user_id=? AND server_id=?",
+                (
+                    warn_id,
+                    user_id,
+                    server_id,
+                ),
+            )
+            if cursor.rowcount > 0:
+                await connection.execute(
+                    "UPDATE warn_counts SET count=MAX(count - ?, 0) WHERE server_id=? AND user_id=?",
+                    (
+                        cursor.rowcount,
+                        server_id,
+                        user_id,
+                    ),
+                )
+            rows = await connection.execute(
+                "SELECT count FROM warn_counts WHERE user_id=? AND server_id=?",
+                (
+                    user_id,
+                    server_id,
+                ),
+            )
+            async with rows as cursor:
+                result = await cursor.fetchone()
+                return result[0] if result is not None else 0
+
+        return await self._write(operation)
+
+    async def get_warn_count(self, user_id: int, server_id: int) -> int:
+        """
+        This function will get the number of warnings of a user.
+
+        :param user_id: The ID of the user that should be checked.
+        :param server_id: The ID of the server that should be checked.
+        :return: The number of warnings of the user.
+        """
+        rows = await self.connection.execute(
+            "SELECT count FROM warn_counts WHERE user_id=? AND server_id=?",
             (
-                warn_id,
                 user_id,
                 server_id,
             ),
         )
-        await self.connection.commit()
+        async with rows as cursor:
+            result = await cursor.fetchone()
+            return result[0] if result is not None else 0
+
+    async def get_warnings_page(
+        self, user_id: int, server_id: int, after_id: int = 0, page_size: int = 10
+    ) -> list:
+        """
+        This function will get one page of the warnings of a user, ordered by warn ID.
+
+        :param user_id: The ID of the user that should be checked.
+        :param server_id: The ID of the server that should be checked.
+        :param after_id: Only warnings with an ID greater than this are returned.
+        :param page_size: The maximum number of warnings to return.
+        :return: A list of at most page_size warnings.
+        """
         rows = await self.connection.execute(
-            "SELECT COUNT(*) FROM warns WHERE user_id=? AND server_id=?",
+            "SELECT user_id, server_id, moderator_id, reason, strftime('%s', created_at), id FROM warns WHERE server_id=? AND user_id=? AND id>? ORDER BY id LIMIT ?",
             (
-                user_id,
                 server_id,
+                user_id,
+                after_id,
+                page_size,
             ),
         )
         async with rows as cursor:
-            result = await cursor.fetchone()
-            return result[0] if result is not None else 0
+            return list(await cursor.fetchall())
+
+    async def iter_warnings(
+        self, user_id: int, server_id: int, after_id: int = 0, page_size: int = 50
+    ):
+        """
+        This function will stream the warnings of a user, one page per query.
+
+        :param user_id: The ID of the user that should be checked.
+        :param server_id: The ID of the server that should be checked.
+        :param after_id: Only warnings with an ID greater than this are returned.
+        :param page_size: The number of warnings fetched per query.
+        """
+        while True:
+            page = await self.get_warnings_page(user_id, server_id, after_id, page_size)
+            for row in page:
+                yield row
+            if len(page) < page_size:
+                return
+            after_id = page[-1][5]
 
     async def get_warnings(self, user_id: int, server_id: int) -> list:
         """
@@ -73,16 +277,202 @@ class DatabaseManager:
         :param server_id: The ID of the server that should be checked.
         :return: A list of all the warnings of the user.
         """
+        return [row async for row in self.iter_warnings(user_id, server_id)]
+
+    async def get_channel_configs(self, kind: str) -> dict:
+        """
+        This function will get all the channel configurations of a listener.
+
+        :param kind: The listener the configurations belong to ("bait" or "sticky").
+        :return: A dict of configurations keyed by name, in the same shape as the defaults.
+        """
+        config_table, channel_table, columns = CHANNEL_CONFIG_TABLES[kind]
         rows = await self.connection.execute(
-            "SELECT user_id, server_id, moderator_id, reason, strftime('%s', created_at), id FROM warns WHERE user_id=? AND server_id=?",
-            (
-                user_id,
-                server_id,
-            ),
+            f"SELECT guild_id, name, {', '.join(columns)} FROM {config_table}"
+        )
+        async with rows as cursor:
+            config_rows = await cursor.fetchall()
+        rows = await self.connection.execute(
+            f"SELECT guild_id, channel_id FROM {channel_table}"
+        )
+        async with rows as cursor:
+            channel_rows = await cursor.fetchall()
+
+        channels = {}
+        for guild_id, channel_id in channel_rows:
+            channels.setdefault(guild_id, []).append(channel_id)
+
+        configs = {}
+        for row in config_rows:
+            guild_id, name = row[0], row[1]
+            config = {"guild_id": guild_id, "channel_ids": channels.get(guild_id, [])}
+            for column, value in zip(columns, row[2:]):
+                if value is not None:
+                    config[column] = value
+            configs[name] = config
+        return configs
+
+    async def seed_channel_config(self, kind: str, name: str, config: dict) -> bool:
+        """
+        This function will store a default configuration the first time it is seen.
+
+        A default that was seeded once is never inserted again, so deleting its
+        rows sticks across reloads and restarts.
+
+        :param kind: The listener the configuration belongs to ("bait" or "sticky").
+        :param name: The name of the configuration.
+        :param config: The configuration, in the same shape as the defaults.
+        :return: True if the configuration was inserted.
+        """
+        config_table, channel_table, columns = CHANNEL_CONFIG_TABLES[kind]
+        guild_id = config.get("guild_id")
+        present = [column for column in columns if column in config]
+
+        async def operation(connection: aiosqlite.Connection) -> bool:
+            cursor = await connection.execute(
+                "INSERT OR IGNORE INTO channel_config_seeds(kind, name) VALUES (?, ?)",
+                (
+                    kind,
+                    name,
+                ),
+            )
+            if cursor.rowcount == 0:
+                return False
+            cursor = await connection.execute(
+                f"INSERT OR IGNORE INTO {config_table}(guild_id, name{''.join(', ' + c for c in present)}) "
+                f"VALUES (?, ?{', ?' * len(present)})",
+                (guild_id, name, *(config[column] for column in present)),
+            )
+            if cursor.rowcount == 0:
+                return False
+            await connection.executemany(
+                f"INSERT OR IGNORE INTO {channel_table}(guild_id, channel_id) VALUES (?, ?)",
+                [
+                    (guild_id, channel_id)
+                    for channel_id in config.get("channel_ids", [])
+                ],
+            )
+            return True
+
+        return await self._write(operation)
+
+    async def add_config_channel(
+        self, kind: str, guild_id: int, channel_id: int
+    ) -> bool:
+        """
+        This function will add a channel to the configuration of a guild.
+
+        :param kind: The listener the configuration belongs to ("bait" or "sticky").
+        :param guild_id: The ID of the guild.
+        :param channel_id: The ID of the channel that should be added.
+        :return: True if the channel was added, False if it already was configured.
+        """
+        _, channel_table, _ = CHANNEL_CONFIG_TABLES[kind]
+
+        async def operation(connection: aiosqlite.Connection) -> bool:
+            cursor = await connection.execute(
+                f"INSERT OR IGNORE INTO {channel_table}(guild_id, channel_id) VALUES (?, ?)",
+                (
+                    guild_id,
+                    channel_id,
+                ),
+            )
+            return cursor.rowcount > 0
+
+        return await self._write(operation)
+
+    async def remove_config_channel(
+        self, kind: str, guild_id: int, channel_id: int
+    ) -> bool:
+        """
+        This function will remove a channel from the configuration of a guild.
+
+        :param kind: The listener the configuration belongs to ("bait" or "sticky").
+        :param guild_id: The ID of the guild.
+        :param channel_id: The ID of the channel that should be removed.
+        :return: True if the channel was removed, False if it was not configured.
+        """
+        _, channel_table, _ = CHANNEL_CONFIG_TABLES[kind]
+
+        async def operation(connection: aiosqlite.Connection) -> bool:
+            cursor = await connection.execute(
+                f"DELETE FROM {channel_table} WHERE guild_id=? AND channel_id=?",
+                (
+                    guild_id,
+                    channel_id,
+                ),
+            )
+            return cursor.rowcount > 0
+
+        return await self._write(operation)
+
+    async def get_sticky_messages(self) -> dict:
+        """
+        This function will get the last sticky message of every channel.
+
+        :return: A dict mapping channel IDs to message IDs.
+        """
+        rows = await self.connection.execute(
+            "SELECT channel_id, message_id FROM sticky_messages"
+        )
+        async with rows as cursor:
+            return dict(await cursor.fetchall())
+
+    async def set_sticky_message(self, channel_id: int, message_id: int) -> None:
+        """
+        This function will store the last sticky message of a channel.
+
+        :param channel_id: The ID of the channel.
+        :param message_id: The ID of the sticky message that was sent.
+        """
+
+        async def operation(connection: aiosqlite.Connection) -> None:
+            await connection.execute(
+                "INSERT INTO sticky_messages(channel_id, message_id) VALUES (?, ?) "
+                "ON CONFLICT(channel_id) DO UPDATE SET message_id=excluded.message_id, updated_at=CURRENT_TIMESTAMP",
+                (
+                    channel_id,
+                    message_id,
+                ),
+            )
+
+        await self._write(operation)
+
+    async def get_dictionary_entry(self, word: str):
+        """
+        This function will get a cached dictionary lookup that has not expired yet.
+
+        :param word: The lowercased word that was looked up.
+        :return: A (data, expires_at) tuple, data being None for unknown words, or None when not cached.
+        """
+        rows = await self.connection.execute(
+            "SELECT data, expires_at FROM dictionary_cache WHERE word=? AND expires_at>strftime('%s','now')",
+            (word,),
         )
         async with rows as cursor:
-            result = await cursor.fetchall()
-            result_list = []
-            for row in result:
-                result_list.append(row)
-            return result_list
+            return await cursor.fetchone()
+
+    async def set_dictionary_entry(self, word: str, data, expires_at: int) -> None:
+        """
+        This function will store a dictionary lookup and drop expired ones.
+
+        :param word: The lowercased word that was looked up.
+        :param data: The JSON encoded definitions, or None if the word was not found.
+        :param expires_at: The UNIX timestamp after which the entry is stale.
+        """
+
+        async def operation(connection: aiosqlite.Connection) -> None:
+            await connection.execute(
+                "INSERT INTO dictionary_cache(word, data, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(word) DO UPDATE SET data=excluded.data, expires_at=excluded.expires_at",
+                (
+                    word,
+                    data,
+                    expires_at,
+                ),
+            )
+            await connection.execute(
+                "DELETE FROM dictionary_cache WHERE expires_at<=strftime('%s','now')"
+            )
+
+        await self._write(operation)
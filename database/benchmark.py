@@ -0,0 +1,114 @@
+"""
+Seeds a scratch database with warns and measures the lookups used by
+DatabaseManager before and after the migrations are applied.
+
+Usage: python -m database.benchmark [--rows 1000000] [--lookups 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+import aiosqlite
+
+from .migrate import apply_migrations
+
+SCHEMA_PATH = os.path.join(os.path.realpath(os.path.dirname(__file__)), "schema.sql")
+
+QUERIES = {
+    "get_warnings": "SELECT user_id, server_id, moderator_id, reason, strftime('%s', created_at), id FROM warns WHERE user_id=? AND server_id=?",
+    "next_id": "SELECT COALESCE(MAX(id), 0) + 1 FROM warns WHERE user_id=? AND server_id=?",
+    "count": "SELECT COUNT(*) FROM warns WHERE user_id=? AND server_id=?",
+}
+
+
+def seed(path: str, rows: int, guilds: int, users: int) -> list:
+    connection = sqlite3.connect(path)
+    with open(SCHEMA_PATH, encoding="utf-8") as file:
+        connection.executescript(file.read())
+
+    rng = random.Random(0)
+    next_ids = {}
+    batch = []
+    for _ in range(rows):
+        key = (str(rng.randrange(users)), str(rng.randrange(guilds)))
+        next_ids[key] = next_ids.get(key, 0) + 1
+        batch.append((next_ids[key], key[0], key[1], "0", "benchmark"))
+        if len(batch) >= 50000:
+            connection.executemany(
+                "INSERT INTO warns(id, user_id, server_id, moderator_id, reason) VALUES (?, ?, ?, ?, ?)",
+                batch,
+            )
+            batch.clear()
+    if batch:
+        connection.executemany(
+            "INSERT INTO warns(id, user_id, server_id, moderator_id, reason) VALUES (?, ?, ?, ?, ?)",
+            batch,
+        )
+    connection.commit()
+    connection.close()
+    return list(next_ids)
+
+
+def measure(path: str, keys: list, lookups: int) -> dict:
+    connection = sqlite3.connect(path)
+    rng = random.Random(1)
+    samples = [rng.choice(keys) for _ in range(lookups)]
+    results = {}
+    for name, query in QUERIES.items():
+        timings = []
+        for user_id, server_id in samples:
+            start = time.perf_counter()
+            connection.execute(query, (user_id, server_id)).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        results[name] = (
+            statistics.median(timings),
+            timings[int(len(timings) * 0.99) - 1],
+        )
+    connection.close()
+    return results
+
+
+async def migrate(path: str) -> list:
+    async with aiosqlite.connect(path) as connection:
+        return await apply_migrations(connection)
+
+
+def report(label: str, results: dict) -> None:
+    print(label)
+    for name, (p50, p99) in results.items():
+        print(f"  {name:<14} p50 {p50:9.3f} ms   p99 {p99:9.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--guilds", type=int, default=500)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.db")
+
+        start = time.perf_counter()
+        keys = seed(path, args.rows, args.guilds, args.users)
+        print(f"Seeded {args.rows} warns in {time.perf_counter() - start:.1f}s")
+
+        report("Before migrations:", measure(path, keys, args.lookups))
+
+        start = time.perf_counter()
+        applied = asyncio.run(migrate(path))
+        print(f"Applied migrations {applied} in {time.perf_counter() - start:.1f}s")
+
+        report("After migrations:", measure(path, keys, args.lookups))
+
+
+if __name__ == "__main__":
+    main()
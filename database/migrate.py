@@ -0,0 +1,77 @@
+import asyncio
+import os
+import re
+
+import aiosqlite
+
+MIGRATIONS_PATH = os.path.join(
+    os.path.realpath(os.path.dirname(__file__)), "migrations"
+)
+MIGRATION_PATTERN = re.compile(r"^(\d+)_[\w-]+\.sql$")
+
+
+def read_migration(file_path: str) -> str:
+    with open(file_path, encoding="utf-8") as file:
+        return file.read()
+
+
+def get_migrations(path: str = MIGRATIONS_PATH) -> list:
+    """
+    This function will list the migration files in version order.
+
+    :param path: The directory containing the migration files.
+    :return: A list of (version, file path) tuples.
+    """
+    migrations = []
+    for file in os.listdir(path):
+        match = MIGRATION_PATTERN.match(file)
+        if match:
+            migrations.append((int(match.group(1)), os.path.join(path, file)))
+    return sorted(migrations)
+
+
+async def get_schema_version(connection: aiosqlite.Connection) -> int:
+    await connection.execute(
+        "CREATE TABLE IF NOT EXISTS `schema_version` ("
+        "`version` INTEGER PRIMARY KEY, "
+        "`applied_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+    )
+    rows = await connection.execute(
+        "SELECT COALESCE(MAX(version), 0) FROM schema_version"
+    )
+    async with rows as cursor:
+        result = await cursor.fetchone()
+        return result[0]
+
+
+async def apply_migrations(
+    connection: aiosqlite.Connection, path: str = MIGRATIONS_PATH
+) -> list:
+    """
+    This function will apply every migration newer than the current schema version.
+
+    Each migration runs in its own transaction together with its version bump,
+    so a failing migration leaves the database at the previous version.
+
+    :param connection: The connection to migrate.
+    :param path: The directory containing the migration files.
+    :return: The list of versions that were applied.
+    """
+    current = await get_schema_version(connection)
+    await connection.commit()
+
+    applied = []
+    for version, file_path in get_migrations(path):
+        if version <= current:
+            continue
+        script = await asyncio.to_thread(read_migration, file_path)
+        try:
+            await connection.executescript(
+                f"BEGIN;\n{script}\n"
+                f"INSERT INTO schema_version(version) VALUES ({version});\nCOMMIT;"
+            )
+        except Exception:
+            await connection.rollback()
+            raise
+        applied.append(version)
+    return applied
@@ -0,0 +1,18 @@
+CREATE TABLE `warns_new` (
+  `pk` INTEGER PRIMARY KEY,
+  `id` int(11) NOT NULL,
+  `user_id` varchar(20) NOT NULL,
+  `server_id` varchar(20) NOT NULL,
+  `moderator_id` varchar(20) NOT NULL,
+  `reason` varchar(255) NOT NULL,
+  `created_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO `warns_new` (`id`, `user_id`, `server_id`, `moderator_id`, `reason`, `created_at`)
+SELECT `id`, `user_id`, `server_id`, `moderator_id`, `reason`, `created_at` FROM `warns`;
+
+DROP TABLE `warns`;
+
+ALTER TABLE `warns_new` RENAME TO `warns`;
+
+CREATE INDEX IF NOT EXISTS `idx_warns_server_user_id` ON `warns` (`server_id`, `user_id`, `id`);
@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS `warn_counts` (
+  `server_id` varchar(20) NOT NULL,
+  `user_id` varchar(20) NOT NULL,
+  `count` INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (`server_id`, `user_id`)
+) WITHOUT ROWID;
+
+INSERT OR REPLACE INTO `warn_counts` (`server_id`, `user_id`, `count`)
+SELECT `server_id`, `user_id`, COUNT(*) FROM `warns` GROUP BY `server_id`, `user_id`;
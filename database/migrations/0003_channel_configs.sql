@@ -0,0 +1,27 @@
+CREATE TABLE IF NOT EXISTS `bait_configs` (
+  `guild_id` INTEGER PRIMARY KEY,
+  `name` varchar(100) NOT NULL,
+  `protected_role_id` INTEGER,
+  `log_channel_id` INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS `bait_channels` (
+  `guild_id` INTEGER NOT NULL,
+  `channel_id` INTEGER NOT NULL,
+  PRIMARY KEY (`guild_id`, `channel_id`)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS `sticky_configs` (
+  `guild_id` INTEGER PRIMARY KEY,
+  `name` varchar(100) NOT NULL,
+  `allowed_role_id` INTEGER,
+  `message` TEXT NOT NULL,
+  `footer` TEXT NOT NULL DEFAULT 'This is an automated sticky message.',
+  `delay` INTEGER NOT NULL DEFAULT 10
+);
+
+CREATE TABLE IF NOT EXISTS `sticky_channels` (
+  `guild_id` INTEGER NOT NULL,
+  `channel_id` INTEGER NOT NULL,
+  PRIMARY KEY (`guild_id`, `channel_id`)
+) WITHOUT ROWID;
@@ -0,0 +1,5 @@
+CREATE TABLE IF NOT EXISTS `sticky_messages` (
+  `channel_id` INTEGER PRIMARY KEY,
+  `message_id` INTEGER NOT NULL,
+  `updated_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
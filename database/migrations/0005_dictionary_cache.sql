@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS `dictionary_cache` (
+  `word` TEXT PRIMARY KEY,
+  `data` TEXT,
+  `expires_at` INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS `idx_dictionary_cache_expires_at` ON `dictionary_cache` (`expires_at`);
@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS `channel_config_seeds` (
+  `kind` varchar(20) NOT NULL,
+  `name` varchar(100) NOT NULL,
+  PRIMARY KEY (`kind`, `name`)
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO `channel_config_seeds`(kind, name) SELECT 'bait', name FROM `bait_configs`;
+INSERT OR IGNORE INTO `channel_config_seeds`(kind, name) SELECT 'sticky', name FROM `sticky_configs`;
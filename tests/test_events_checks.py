@@ -0,0 +1,69 @@
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from cogs.events import Events
+from cogs.events.baitbot import BAIT_CONFIGS
+from cogs.events.stickybot import STICKY_CONFIGS
+
+GUILD_ID = 1
+ROLE_ID = 2
+
+
+class FakeBot:
+    logger = SimpleNamespace(warning=lambda message: None)
+
+    async def can_run(self, context, *, call_once=False):
+        return True
+
+
+class FakeContext:
+    def __init__(self, bot):
+        default_role = SimpleNamespace(id=GUILD_ID, position=0)
+        protected_role = SimpleNamespace(id=ROLE_ID, position=5)
+        roles = {ROLE_ID: protected_role}
+        self.bot = bot
+        self.guild = SimpleNamespace(
+            id=GUILD_ID,
+            name="Test",
+            default_role=default_role,
+            get_role=roles.get,
+        )
+        self.author = SimpleNamespace(id=3, roles=[default_role])
+        self.permissions = discord.Permissions(manage_guild=True)
+        self.command = None
+        self.sent = []
+
+    async def send(self, *args, **kwargs):
+        self.sent.append(kwargs.get("embed"))
+
+
+@pytest.fixture
+def configs(monkeypatch):
+    monkeypatch.setitem(
+        BAIT_CONFIGS, "test", {"guild_id": GUILD_ID, "protected_role_id": ROLE_ID}
+    )
+    monkeypatch.setitem(
+        STICKY_CONFIGS, "test", {"guild_id": GUILD_ID, "allowed_role_id": ROLE_ID}
+    )
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "events_group_baitbot_add",
+        "events_group_baitbot_remove",
+        "events_group_stickybot_add",
+        "events_group_stickybot_remove",
+    ],
+)
+def test_config_subcommands_require_role(configs, name):
+    bot = FakeBot()
+    cog = Events(bot)
+    command = getattr(cog, name)
+    context = FakeContext(bot)
+
+    assert asyncio.run(command.can_run(context)) is False
+    assert context.sent and context.sent[0].title == "Permission Denied"
@@ -3,6 +3,11 @@ from .logging import LoggingFormatter, setup_logger
 from .time import get_uptime
 from .signal import setup_signal_handlers
 from .contributors import generate_contributors_image
+from .http import HTTPClient
+from .routing import build_channel_index
+from .cache import TTLCache
+from .github import GitHubClient, RateLimitError
+from .banner import banner_needs_render, render_banner
 
 __all__ = [
     "ascii",
@@ -14,4 +19,11 @@ __all__ = [
     "get_uptime",
     "setup_signal_handlers",
     "generate_contributors_image",
+    "HTTPClient",
+    "build_channel_index",
+    "TTLCache",
+    "GitHubClient",
+    "RateLimitError",
+    "banner_needs_render",
+    "render_banner",
 ]
@@ -0,0 +1,86 @@
+import time
+from io import BytesIO
+from math import ceil
+
+from PIL import Image
+
+BANNER_WIDTH = 1100
+BANNER_HEIGHT = 440
+
+# Animated banners keep at most this many frames, evenly sampled
+MAX_BANNER_FRAMES = 48
+
+# Seconds spent resizing frames before the remaining ones are dropped
+BANNER_FRAME_BUDGET = 3
+
+
+def banner_needs_render(banner_data: bytes) -> bool:
+    """
+    Reads only the image header to tell whether a banner is narrower than
+    1100px and so needs rendering.
+    """
+    with Image.open(BytesIO(banner_data)) as img:
+        return img.width < BANNER_WIDTH
+
+
+def render_banner(banner_data: bytes, is_animated: bool):
+    """
+    Scales a banner up to 1100x440 and crops it to fill, keeping animation.
+
+    Runs in a worker process, so it only takes and returns plain bytes.
+
+    :param banner_data: The downloaded banner image.
+    :param is_animated: Whether the banner is an animated GIF.
+    :return: The rendered image bytes, or None if the banner is already large enough.
+    """
+    img = Image.open(BytesIO(banner_data))
+    if img.width >= BANNER_WIDTH:
+        return None
+
+    img_aspect = img.width / img.height
+    target_aspect = BANNER_WIDTH / BANNER_HEIGHT
+
+    if img_aspect > target_aspect:
+        crop_width = img.height * target_aspect
+        crop_height = img.height
+    else:
+        crop_width = img.width
+        crop_height = img.width / target_aspect
+
+    left = (img.width - crop_width) / 2
+    top = (img.height - crop_height) / 2
+    box = (left, top, left + crop_width, top + crop_height)
+    size = (BANNER_WIDTH, BANNER_HEIGHT)
+
+    output = BytesIO()
+    if not is_animated:
+        img = img.resize(size, Image.Resampling.LANCZOS, box=box)
+        img.save(output, format="PNG")
+        return output.getvalue()
+
+    frame_count = getattr(img, "n_frames", 1)
+    step = ceil(frame_count / MAX_BANNER_FRAMES)
+    deadline = time.monotonic() + BANNER_FRAME_BUDGET
+
+    frames = []
+    durations = []
+    for index in range(frame_count):
+        img.seek(index)
+        if index % step == 0:
+            if frames and time.monotonic() > deadline:
+                break
+            frame = img.convert("RGBA").resize(size, Image.Resampling.LANCZOS, box=box)
+            frames.append(frame)
+            durations.append(0)
+        durations[-1] += img.info.get("duration", 100)
+
+    frames[0].save(
+        output,
+        format="GIF",
+        save_all=True,
+        append_images=frames[1:],
+        duration=durations,
+        loop=0,
+        optimize=False,
+    )
+    return output.getvalue()
@@ -0,0 +1,101 @@
+"""
+Measures what each hybrid command invocation used to pay to rebuild its command
+object from the factory, and times a ping invocation through the prebuilt
+module-level command next to the same invocation rebuilding it first.
+
+Usage: python -m utils.benchmark [--iterations 200]
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import os
+import statistics
+import time
+from types import SimpleNamespace
+
+from cogs.general import _ping
+from cogs.general.ping import ping_command
+
+COGS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "cogs"
+)
+
+
+def find_factories() -> dict:
+    factories = {}
+    for folder in sorted(os.listdir(COGS_PATH)):
+        if not os.path.exists(os.path.join(COGS_PATH, folder, "__init__.py")):
+            continue
+        package = importlib.import_module(f"cogs.{folder}")
+        for name, value in vars(package).items():
+            if (
+                name.endswith("_command")
+                and inspect.isfunction(value)
+                and value.__module__.startswith(f"cogs.{folder}.")
+            ):
+                factories[f"{folder}.{name[: -len('_command')]}"] = value
+    return factories
+
+
+def measure(factory, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        factory()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(timings)
+
+
+def measure_invocation(call, iterations: int) -> float:
+    cog = SimpleNamespace(bot=SimpleNamespace(latency=0.05))
+
+    async def send(**kwargs):
+        return None
+
+    context = SimpleNamespace(interaction=None, send=send)
+
+    async def run() -> float:
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await call(cog, context)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+        return statistics.median(timings)
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    factories = find_factories()
+    results = {
+        name: measure(factory, args.iterations) for name, factory in factories.items()
+    }
+
+    for name, p50 in sorted(results.items(), key=lambda item: -item[1]):
+        print(f"  {name:<28} {p50:9.1f} us")
+
+    timings = sorted(results.values())
+    print(f"{len(timings)} commands")
+    print(
+        f"  rebuilt per invocation  p50 {statistics.median(timings):8.1f} us   max {timings[-1]:8.1f} us"
+    )
+    print(f"  one-time build of all   {sum(timings) / 1000:8.2f} ms")
+
+    async def rebuilt(cog, context):
+        return await ping_command()(cog, context)
+
+    prebuilt_p50 = measure_invocation(_ping, args.iterations)
+    rebuilt_p50 = measure_invocation(rebuilt, args.iterations)
+    print("ping invocation")
+    print(f"  rebuilt per invocation  p50 {rebuilt_p50:8.1f} us")
+    print(f"  built once at import    p50 {prebuilt_p50:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "cache"
+)
+
+# Once a namespace grows past its limit it is trimmed down to this fraction of it
+CACHE_TRIM_RATIO = 0.9
+
+_MISSING = object()
+_CACHE_SIZES = {}
+_CACHE_SIZES_LOCK = threading.Lock()
+
+
+def get_cache_dir() -> str:
+    # Read on use so a CACHE_DIR loaded from .env after import still applies
+    return os.getenv("CACHE_DIR") or DEFAULT_CACHE_DIR
+
+
+def cache_path(namespace: str, key: str, suffix: str = "") -> str:
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(get_cache_dir(), namespace, digest[:2], digest + suffix)
+
+
+def read_cache_file(path: str, max_age: float | None = None):
+    try:
+        if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, "rb") as file:
+            return file.read()
+    except OSError:
+        return None
+
+
+def scan_cache_dir(directory: str) -> list:
+    entries = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.endswith(".tmp"):
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def trim_cache_dir(directory: str, max_bytes: int) -> int:
+    """
+    Deletes the least recently written files of a cache directory until it is
+    below CACHE_TRIM_RATIO of max_bytes.
+
+    :param directory: The cache namespace directory.
+    :param max_bytes: The size limit of the directory.
+    :return: The size of the directory afterwards.
+    """
+    entries = sorted(scan_cache_dir(directory))
+    total = sum(size for _, size, _ in entries)
+    target = max_bytes * CACHE_TRIM_RATIO
+    for _, size, path in entries:
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+    return total
+
+
+def write_cache_file(path: str, data: bytes, max_bytes: int | None = None) -> None:
+    """
+    Atomically writes a cache file.
+
+    With max_bytes, the namespace directory the path belongs to (see cache_path)
+    is kept under that size by dropping its oldest files.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+    if max_bytes is None:
+        return
+    directory = os.path.dirname(os.path.dirname(path))
+    with _CACHE_SIZES_LOCK:
+        size = _CACHE_SIZES.get(directory)
+        if size is None:
+            size = sum(entry[1] for entry in scan_cache_dir(directory))
+        else:
+            size += len(data)
+        if size > max_bytes:
+            size = trim_cache_dir(directory, max_bytes)
+        _CACHE_SIZES[directory] = size
+
+
+class TTLCache:
+    """
+    A bounded LRU cache whose entries expire after a fixed number of seconds.
+
+    Expired entries are kept until they are evicted so callers can still read
+    them with ``get_stale`` (for example to revalidate with an ETag).
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def get_stale(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def touch(self, key, ttl: float | None = None) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.set(key, entry[1], ttl)
+
+    def pop(self, key, default=None):
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
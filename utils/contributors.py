@@ -1,29 +1,46 @@
+import asyncio
+import hashlib
 from io import BytesIO
 from math import ceil
 
-import requests
+import aiohttp
 from PIL import Image
 
+from .cache import TTLCache, cache_path, read_cache_file, write_cache_file
+from .github import RateLimitError
+
+# Number of avatars downloaded at the same time
+AVATAR_CONCURRENCY = 8
+
+# Seconds a cached avatar is reused before it is downloaded again
+AVATAR_CACHE_MAX_AGE = 86400
+
+# Disk space the avatar and contributor grid caches may use, in bytes
+AVATAR_CACHE_MAX_BYTES = 32 * 1024 * 1024
+CONTRIBUTORS_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+CONTRIBUTORS_CACHE = TTLCache(maxsize=8, ttl=600)
+
+
+async def fetch_contributors(github, owner, repo):
+    cached = CONTRIBUTORS_CACHE.get((owner, repo))
+    if cached is not None:
+        return cached
 
-def fetch_contributors(owner, repo):
     contributors = []
     page = 1
 
     while True:
-        url = f"https://api.github.com/repos/{owner}/{repo}/contributors"
+        url = f"/repos/{owner}/{repo}/contributors"
         params = {"page": page, "per_page": 100}
 
-        headers = {
-            "User-Agent": "github-contributors-graph",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
-        response = requests.get(url, headers=headers, params=params)
-
-        if not response.ok:
-            return []
-
-        data = response.json()
+        try:
+            async with github.get(url, params=params) as response:
+                if response.status != 200:
+                    return []
+                data = await response.json()
+        except RateLimitError:
+            break
 
         if not data:
             break
@@ -31,52 +48,43 @@ def fetch_contributors(owner, repo):
         contributors.extend(data)
         page += 1
 
-        if response.headers.get("X-RateLimit-Remaining") == "0":
-            break
-
+    if contributors:
+        CONTRIBUTORS_CACHE.set((owner, repo), contributors)
     return contributors
 
 
-def download_avatar(avatar_url, size):
+async def download_avatar(http, avatar_url, size, semaphore):
+    path = cache_path("avatars", f"{avatar_url}:{size}")
+    content = await asyncio.to_thread(read_cache_file, path, AVATAR_CACHE_MAX_AGE)
+    if content is not None:
+        return content
+
     try:
         if "avatars.githubusercontent.com" in avatar_url:
-            avatar_url = f"{avatar_url}?s={size}"
+            separator = "&" if "?" in avatar_url else "?"
+            avatar_url = f"{avatar_url}{separator}s={size}"
 
-        response = requests.get(avatar_url, timeout=10)
-
-        if not response.ok:
-            return None
+        async with semaphore, http.get(avatar_url) as response:
+            if response.status != 200:
+                return None
+            content = await response.read()
 
-        img = Image.open(BytesIO(response.content))
+        await asyncio.to_thread(write_cache_file, path, content, AVATAR_CACHE_MAX_BYTES)
+        return content
 
-        if img.size != (size, size):
-            img = img.resize((size, size), Image.Resampling.LANCZOS)
-
-        return img
-
-    except Exception:
+    except (aiohttp.ClientError, TimeoutError, OSError):
         return None
 
 
-def generate_contributors_image(
-    owner="neoarz", repo="syntrel", size=64, images_per_row=20
-):
-    contributors = fetch_contributors(owner, repo)
-
-    if not contributors:
-        return None
-
+def compose_grid(avatars, size, images_per_row):
     images = []
 
-    for contributor in contributors:
-        avatar_url = contributor.get("avatar_url")
-
-        if not avatar_url:
-            continue
-
-        img = download_avatar(avatar_url, size)
-
-        if img is None:
+    for content in avatars:
+        try:
+            img = Image.open(BytesIO(content))
+            if img.size != (size, size):
+                img = img.resize((size, size), Image.Resampling.LANCZOS)
+        except (OSError, ValueError):
             continue
 
         images.append(img)
@@ -101,6 +109,48 @@ def generate_contributors_image(
 
     buffer = BytesIO()
     canvas.save(buffer, "PNG")
-    buffer.seek(0)
+    return buffer.getvalue()
+
+
+async def generate_contributors_image(
+    github, owner="neoarz", repo="syntrel", size=64, images_per_row=20
+):
+    contributors = await fetch_contributors(github, owner, repo)
+
+    if not contributors:
+        return None
+
+    avatar_urls = [
+        contributor["avatar_url"]
+        for contributor in contributors
+        if contributor.get("avatar_url")
+    ]
+    if not avatar_urls:
+        return None
+
+    digest = hashlib.sha256(
+        "\n".join([f"{size}:{images_per_row}", *avatar_urls]).encode("utf-8")
+    ).hexdigest()
+    path = cache_path("contributors", f"{owner}/{repo}:{digest}", ".png")
+
+    image = await asyncio.to_thread(read_cache_file, path)
+    if image is None:
+        semaphore = asyncio.Semaphore(AVATAR_CONCURRENCY)
+        avatars = await asyncio.gather(
+            *(
+                download_avatar(github.http, avatar_url, size, semaphore)
+                for avatar_url in avatar_urls
+            )
+        )
+        avatars = [avatar for avatar in avatars if avatar is not None]
+        if not avatars:
+            return None
+
+        image = await asyncio.to_thread(compose_grid, avatars, size, images_per_row)
+        if image is None:
+            return None
+        await asyncio.to_thread(
+            write_cache_file, path, image, CONTRIBUTORS_CACHE_MAX_BYTES
+        )
 
-    return buffer
+    return BytesIO(image)
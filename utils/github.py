@@ -0,0 +1,98 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
+API_URL = "https://api.github.com"
+
+# Requests kept in reserve so concurrent callers don't overshoot the limit
+RATE_LIMIT_RESERVE = 1
+
+# Longest wait (seconds) for a reset before requests are rejected instead of queued
+MAX_RATE_LIMIT_WAIT = 5
+
+
+class RateLimitError(Exception):
+    def __init__(self, reset: float) -> None:
+        super().__init__("GitHub API rate limit exhausted")
+        self.reset = reset
+
+
+class GitHubClient:
+    def __init__(self, http, *, token: str = None) -> None:
+        self.http = http
+        self.token = token if token is not None else os.getenv("GITHUB_TOKEN")
+        self.limit = 5000 if self.token else 60
+        self.remaining = self.limit
+        self.reset = 0.0
+        self.in_flight = 0
+
+    @property
+    def authenticated(self) -> bool:
+        return bool(self.token)
+
+    def budget(self) -> dict:
+        if self.reset <= time.time():
+            return {"remaining": self.limit, "limit": self.limit, "reset": None}
+        return {"remaining": self.remaining, "limit": self.limit, "reset": self.reset}
+
+    def _headers(self, headers=None) -> dict:
+        merged = {
+            "User-Agent": "Syntrel",
+            "Accept": "application/vnd.github.v3+json",
+        }
+        if self.token:
+            merged["Authorization"] = f"Bearer {self.token}"
+        merged.update(headers or {})
+        return merged
+
+    def _update(self, response) -> None:
+        if response.headers.get("X-RateLimit-Resource", "core") != "core":
+            return
+        try:
+            self.limit = int(response.headers["X-RateLimit-Limit"])
+            self.remaining = int(response.headers["X-RateLimit-Remaining"])
+            self.reset = float(response.headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            pass
+
+    async def _reserve(self) -> None:
+        while self.reset > time.time() and (
+            self.remaining - self.in_flight <= RATE_LIMIT_RESERVE
+        ):
+            wait = self.reset - time.time()
+            if wait > MAX_RATE_LIMIT_WAIT:
+                raise RateLimitError(self.reset)
+            await asyncio.sleep(wait + 0.5)
+        self.in_flight += 1
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, *, headers=None, **kwargs):
+        """
+        Perform a GitHub API request, tracking the shared rate limit budget.
+
+        Raises RateLimitError instead of sending the request when the budget is
+        exhausted and the reset is more than MAX_RATE_LIMIT_WAIT seconds away.
+
+        :param method: The HTTP method to use.
+        :param url: An API path (``/repos/...``) or a full URL.
+        :param headers: Extra headers, merged over the defaults.
+        """
+        if url.startswith("/"):
+            url = API_URL + url
+        await self._reserve()
+        released = False
+        try:
+            async with self.http.request(
+                method, url, headers=self._headers(headers), **kwargs
+            ) as response:
+                self._update(response)
+                self.in_flight -= 1
+                released = True
+                yield response
+        finally:
+            if not released:
+                self.in_flight -= 1
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
@@ -0,0 +1,134 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Only idempotent methods are retried unless a call passes retries explicitly
+RETRY_METHODS = {"GET", "HEAD"}
+
+
+class HTTPClient:
+    def __init__(
+        self,
+        *,
+        limit: int | None = None,
+        limit_per_host: int | None = None,
+        dns_ttl: int | None = None,
+        keepalive_timeout: float | None = None,
+        timeout: float | None = None,
+        retries: int | None = None,
+        backoff: float | None = None,
+    ) -> None:
+        if limit is None:
+            limit = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+        if limit_per_host is None:
+            limit_per_host = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+        if dns_ttl is None:
+            dns_ttl = int(os.getenv("HTTP_DNS_TTL", "300"))
+        if keepalive_timeout is None:
+            keepalive_timeout = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+        if timeout is None:
+            timeout = float(os.getenv("HTTP_TIMEOUT", "15"))
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.retries = (
+            retries if retries is not None else int(os.getenv("HTTP_RETRIES", "2"))
+        )
+        self.backoff = (
+            backoff if backoff is not None else float(os.getenv("HTTP_BACKOFF", "0.5"))
+        )
+        self._session = None
+        self._closed = False
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._closed:
+            raise RuntimeError("HTTP client is closed")
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=None, connect=self.timeout, sock_read=self.timeout
+                ),
+            )
+        return self._session
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _retry_delay(self, attempt: int, response=None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), 30.0)
+                except ValueError:
+                    pass
+        return self.backoff * (2**attempt)
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, *, retries: int | None = None, **kwargs
+    ):
+        """
+        Perform a request on the shared session, retrying connection errors and
+        transient status codes with exponential backoff.
+
+        Only GET and HEAD are retried by default; other methods may not be safe
+        to send twice, so they have to opt in by passing ``retries``.
+
+        :param method: The HTTP method to use.
+        :param url: The URL to request.
+        :param retries: Overrides the retry count for this request.
+        """
+        if retries is None:
+            retries = self.retries if method.upper() in RETRY_METHODS else 0
+        attempt = 0
+        while True:
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, TimeoutError):
+                if attempt >= retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status in RETRY_STATUSES and attempt < retries:
+                delay = self._retry_delay(attempt, response)
+                response.release()
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            break
+
+        try:
+            yield response
+        finally:
+            response.release()
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
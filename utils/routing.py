@@ -0,0 +1,17 @@
+from types import MappingProxyType
+
+
+def build_channel_index(configs: dict) -> MappingProxyType:
+    """
+    Builds a read-only {(guild_id, channel_id): (name, config)} index so
+    per-message listeners can route with a single dict lookup.
+    """
+    index = {}
+    for name, config in configs.items():
+        guild_id = config.get("guild_id")
+        channel_ids = config.get("channel_ids") or []
+        if not channel_ids and config.get("channel_id"):
+            channel_ids = [config["channel_id"]]
+        for channel_id in channel_ids:
+            index.setdefault((guild_id, channel_id), (name, config))
+    return MappingProxyType(index)